@@ -0,0 +1,56 @@
+# src/tessif_examples/_lazy.py
+"""Lazy attribute access for the tessif-examples subpackages."""
+import importlib
+import sys
+
+
+def attach(package, factory_modules):
+    """Create a package's module level ``__getattr__`` and ``__dir__``.
+
+    The returned functions implement :pep:`562` lazy attribute access. A
+    factory's module, and with it tessif, is only imported on first access
+    of the factory or of the module itself. Resolved factories are bound to
+    the package namespace, so later accesses skip ``__getattr__``.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package the functions are attached to. Usually its
+        ``__name__``.
+    factory_modules : dict
+        Mapping of the package's factory names to the names of the
+        submodules defining them.
+
+    Returns
+    -------
+    __getattr__ : ~collections.abc.Callable
+        Module level ``__getattr__`` resolving the factories and their
+        submodules.
+    __dir__ : ~collections.abc.Callable
+        Module level ``__dir__`` listing the factories and their submodules
+        next to the package's already bound attributes.
+    """
+    submodules = frozenset(factory_modules.values())
+
+    def __getattr__(name):
+        """Import a factory's module or a submodule on first access."""
+        if name in submodules:
+            return importlib.import_module(f".{name}", package)
+
+        try:
+            module_name = factory_modules[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+
+        factory = getattr(importlib.import_module(f".{module_name}", package), name)
+        setattr(sys.modules[package], name, factory)
+        return factory
+
+    def __dir__():
+        """List the package's attributes including the not yet imported ones."""
+        names = set(vars(sys.modules[package])) | set(factory_modules)
+        return sorted(names | submodules)
+
+    return __getattr__, __dir__
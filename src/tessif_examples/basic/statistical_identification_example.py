@@ -43,7 +43,7 @@ def create_statistical_identification_example(periods=24):
     pv_hh = pd.read_csv(
         os.path.join(data_directory, "solar_HH_2019.csv"), index_col=0, sep=";"
     )
-    pv_hh = pv_hh.values.flatten()[0:periods]
+    pv_hh = pv_hh.iloc[:, 0].to_numpy(copy=False)[:periods]
     max_pv = np.max(pv_hh)
 
     # # wind onshore:
@@ -57,8 +57,7 @@ def create_statistical_identification_example(periods=24):
     de_hh = pd.read_csv(
         os.path.join(data_directory, "el_demand_HH_2019.csv"), index_col=0, sep=";"
     )
-    de_hh = de_hh["Last (MW)"].values.flatten()[0:periods]
-    de_hh = np.array(de_hh)
+    de_hh = de_hh["Last (MW)"].to_numpy(copy=False)[:periods]
     max_de = np.max(de_hh)
 
     # heat demand:
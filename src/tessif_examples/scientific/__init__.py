@@ -1,10 +1,25 @@
 # src/tessif_examples/scientific/__init__.py
 # flake8: noqa
 """Collection of common scenario examples."""
+from typing import TYPE_CHECKING
 
-from .component_focused import create_component_focused_msc
-from .grid_focused import (
-    create_lossless_commitment_msc,
-    create_transformer_grid_focused_msc,
-)
-from .hamburg_inspired import create_hamburg_inspired_hnp_msc
+from tessif_examples._lazy import attach
+
+if TYPE_CHECKING:
+    from .component_focused import create_component_focused_msc
+    from .grid_focused import (
+        create_lossless_commitment_msc,
+        create_transformer_grid_focused_msc,
+    )
+    from .hamburg_inspired import create_hamburg_inspired_hnp_msc
+
+_FACTORY_MODULES = {
+    "create_component_focused_msc": "component_focused",
+    "create_lossless_commitment_msc": "grid_focused",
+    "create_transformer_grid_focused_msc": "grid_focused",
+    "create_hamburg_inspired_hnp_msc": "hamburg_inspired",
+}
+
+__all__ = list(_FACTORY_MODULES)
+
+__getattr__, __dir__ = attach(__name__, _FACTORY_MODULES)
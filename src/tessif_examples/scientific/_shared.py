@@ -0,0 +1,129 @@
+# src/tessif_examples/scientific/_shared.py
+"""Helpers shared by the load profile driven scientific system models."""
+import functools
+import os
+
+import pandas as pd
+import tessif.frused.namedtuples as nts
+
+from tessif_examples.paths import data_dir
+
+LOAD_PROFILES_DIR = os.path.join(data_dir, "load_profiles")
+"""Directory of the scientific models' load profile csv files."""
+
+UNBOUNDED = nts.MinMax(min=0, max=float("+inf"))
+"""Limits of unconstrained flows and expansions, from zero to infinity."""
+
+
+def validate_periods(periods):
+    """Make sure a system model spans at least one time step.
+
+    Parameters
+    ----------
+    periods : int
+        Number of time steps of the evaluated timeframe.
+
+    Raises
+    ------
+    ValueError
+        Raised if ``periods`` is not positive.
+    """
+    if periods < 1:
+        raise ValueError(f"'periods' must be positive, got {periods}.")
+
+
+def read_csv(filename, columns, periods):
+    """Parse the first ``periods`` rows of a load profiles csv file.
+
+    Only the requested columns are tokenized. They are parsed as floats by
+    pandas' C engine, sparing the dtype inference, which would yield integer
+    columns for short all-zero profiles like night time solar loads.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the csv file inside :attr:`LOAD_PROFILES_DIR`.
+    columns : list
+        Names of the parsed columns.
+    periods : int
+        Number of rows parsed.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Parsed load profiles.
+    """
+    return pd.read_csv(
+        os.path.join(LOAD_PROFILES_DIR, filename),
+        sep=";",
+        usecols=columns,
+        nrows=periods,
+        engine="c",
+        dtype=float,
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_cached(parse, periods):
+    """Run and cache a load profile parser, see :func:`load_profiles`."""
+    series = parse(periods)
+    maxima = series.max(axis=1)
+    series.setflags(write=False)
+    maxima.setflags(write=False)
+    return series, maxima
+
+
+def load_profiles(parse, profiles, periods):
+    """Load a system model's load profiles and their maxima.
+
+    The results of ``parse`` are cached by ``periods`` and kept read-only.
+    Each call hands out a writable copy of the cached profiles, so system
+    models never share their profile arrays.
+
+    Parameters
+    ----------
+    parse : ~collections.abc.Callable
+        Function parsing ``periods`` time steps of load profiles into a
+        :class:`numpy.ndarray` holding one profile per row.
+    profiles : type
+        Named tuple type with one field per row of the parsed array.
+    periods : int
+        Number of time steps parsed.
+
+    Returns
+    -------
+    profiles
+        Named tuple of the :class:`numpy.ndarray` load profiles.
+    maxima
+        Named tuple of each load profile's maximum.
+
+    Raises
+    ------
+    ValueError
+        Raised if ``periods`` is not positive.
+    """
+    validate_periods(periods)
+    series, maxima = _parse_cached(parse, periods)
+    return profiles(*series.copy()), profiles(*maxima)
+
+
+def hourly_timeframe(start, periods):
+    """Create an hourly simulation time frame.
+
+    Each call creates a new index. Its metadata, such as ``name`` and
+    ``freq``, can be changed, so a system model must not share its time
+    frame with other system models.
+
+    Parameters
+    ----------
+    start : str
+        First time step of the time frame.
+    periods : int
+        Number of hourly time steps.
+
+    Returns
+    -------
+    pandas.DatetimeIndex
+        Hourly time frame of ``periods`` time steps beginning at ``start``.
+    """
+    return pd.date_range(start, periods=periods, freq="h")
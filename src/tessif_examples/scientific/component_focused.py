@@ -73,26 +73,26 @@ def create_component_focused_msc(expansion_problem=False, periods=3):
     )
 
     # solar:
-    pv = csv_data["pv"].values.flatten()[0:periods]
+    pv = csv_data["pv"].to_numpy(copy=False)[:periods]
     # scale relative values with the installed pv power
     pv = pv * 1100
 
     # wind onshore:
-    wind_onshore = csv_data["wind_on"].values.flatten()[0:periods]
+    wind_onshore = csv_data["wind_on"].to_numpy(copy=False)[:periods]
     # scale relative values with installed onshore power
     wind_onshore = wind_onshore * 1100
 
     # wind offshore:
-    wind_offshore = csv_data["wind_off"].values.flatten()[0:periods]
+    wind_offshore = csv_data["wind_off"].to_numpy(copy=False)[:periods]
     # scale relative values with installed offshore power
     wind_offshore = wind_offshore * 150
 
     # electricity demand:
-    el_demand = csv_data["el_demand"].values.flatten()[0:periods]
+    el_demand = csv_data["el_demand"].to_numpy(copy=False)[:periods]
     max_el = np.max(el_demand)
 
     # heat demand:
-    th_demand = csv_data["th_demand"].values.flatten()[0:periods]
+    th_demand = csv_data["th_demand"].to_numpy(copy=False)[:periods]
     max_th = np.max(th_demand)
 
     # Creating the individual energy system components:
@@ -1,13 +1,370 @@
 # src/tessif_examples/scientific/grid_focused.py
 """Transformer-Grid-focused tessif system model example."""
-import os
+import collections
+import types
 
 import numpy as np
-import pandas as pd
 import tessif.frused.namedtuples as nts
 from tessif import components, system_model
 
-from tessif_examples.paths import data_dir
+from tessif_examples.scientific import _shared
+
+_GLOBAL_CONSTRAINTS = types.MappingProxyType(
+    {
+        "name": "default",
+        "emissions": float("+inf"),
+    }
+)
+"""Read-only template of the grid focused models' global constraints."""
+
+_COMMON = types.MappingProxyType({"latitude": 42, "longitude": 42, "region": "Here"})
+"""Location parameters shared by the located grid focused components."""
+
+_ProfiledComponent = collections.namedtuple(
+    "_ProfiledComponent",
+    ["name", "profile", "flow", "costs", "sector", "carrier", "located"],
+    defaults=(False,),
+)
+
+# name, profile, flow, flow costs, sector, carrier[, located]
+_LOSSLESS_PROFILED_SOURCES = (
+    _ProfiledComponent(
+        "Solar Panel", "pv", "electricity", 60.85, "Power", "Electricity"
+    ),
+    _ProfiledComponent(
+        "Onshore Wind Power", "w_on", "electricity", 61.1, "Power", "Electricity"
+    ),
+    _ProfiledComponent("Solar Thermal", "s_t", "heat", 73, "Heat", "Hot Water"),
+    _ProfiledComponent(
+        "Offshore Wind Power", "w_off", "electricity", 106.4, "Power", "Electricity"
+    ),
+)
+_LOSSLESS_PROFILED_SINKS = (
+    _ProfiledComponent(
+        "Household Demand", "h_d", "electricity", 0, "Power", "electricity"
+    ),
+    _ProfiledComponent(
+        "Commercial Demand", "c_d", "electricity", 0, "Power", "electricity"
+    ),
+    _ProfiledComponent(
+        "District Heating Demand", "dh_d", "heat", 0, "Heat", "hot Water"
+    ),
+    _ProfiledComponent(
+        "Industrial Demand", "i_d", "electricity", 0, "Power", "electricity"
+    ),
+    _ProfiledComponent(
+        "Car charging Station", "cc_d", "electricity", 0, "Power", "electricity"
+    ),
+)
+
+_TRANSFORMER_GRID_PROFILED_SOURCES = (
+    _ProfiledComponent(
+        "Solar Panel",
+        "pv",
+        "low-voltage-electricity",
+        60.85,
+        "Power",
+        "low-voltage-electricity",
+        located=True,
+    ),
+    _ProfiledComponent(
+        "Onshore Wind Power",
+        "w_on",
+        "medium-voltage-electricity",
+        61.1,
+        "power",
+        "medium-voltage-electricity",
+    ),
+    _ProfiledComponent("Solar Thermal", "s_t", "heat", 73, "Heat", "Hot Water"),
+    _ProfiledComponent(
+        "Offshore Wind Power",
+        "w_off",
+        "high-voltage-electricity",
+        106.4,
+        "Power",
+        "high-voltage-electricity",
+    ),
+)
+_TRANSFORMER_GRID_PROFILED_SINKS = (
+    _ProfiledComponent(
+        "Household Demand",
+        "h_d",
+        "low-voltage-electricity",
+        0,
+        "Power",
+        "low-voltage-electricity",
+    ),
+    _ProfiledComponent(
+        "Commercial Demand",
+        "c_d",
+        "low-voltage-electricity",
+        0,
+        "Power",
+        "low-voltage-electricity",
+    ),
+    _ProfiledComponent(
+        "District Heating Demand", "dh_d", "heat", 0, "Heat", "hot Water", located=True
+    ),
+    _ProfiledComponent(
+        "Industrial Demand",
+        "i_d",
+        "medium-voltage-electricity",
+        0,
+        "Power",
+        "medium-voltage-electricity",
+    ),
+    _ProfiledComponent(
+        "Car charging Station",
+        "cc_d",
+        "medium-voltage-electricity",
+        0,
+        "Power",
+        "medium-voltage-electricity",
+    ),
+)
+
+_GRID_LEVELS = (
+    ("LV", "low-voltage-electricity"),
+    ("MV", "medium-voltage-electricity"),
+    ("HV", "high-voltage-electricity"),
+)
+"""Abbreviations and carriers of the transformer grid's voltage levels."""
+
+_GridTransfer = collections.namedtuple(
+    "_GridTransfer", ["name", "inflow", "outflow", "located"]
+)
+
+# name, inflow, outflow, located
+_GRID_TRANSFERS = (
+    _GridTransfer(
+        "Low Medium Transfer",
+        "low-voltage-electricity",
+        "medium-voltage-electricity",
+        True,
+    ),
+    _GridTransfer(
+        "Medium Low Transfer",
+        "medium-voltage-electricity",
+        "low-voltage-electricity",
+        True,
+    ),
+    _GridTransfer(
+        "Medium High Transfer",
+        "medium-voltage-electricity",
+        "high-voltage-electricity",
+        False,
+    ),
+    _GridTransfer(
+        "High Medium Transfer",
+        "high-voltage-electricity",
+        "medium-voltage-electricity",
+        False,
+    ),
+)
+
+_LoadProfiles = collections.namedtuple(
+    "_LoadProfiles", ["pv", "w_on", "w_off", "s_t", "h_d", "i_d", "c_d", "dh_d", "cc_d"]
+)
+
+
+def _parse_load_profiles(periods):
+    """Parse the demand and renewables load data of the grid focused models.
+
+    Used through :func:`tessif_examples.scientific._shared.load_profiles`.
+
+    Parameters
+    ----------
+    periods : int
+        Number of rows parsed from each csv file.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array holding one load profile per row, in the order of
+        :class:`_LoadProfiles`' fields.
+    """
+    renewables = _shared.read_csv(
+        "Renewable_Energy.csv", ["pv_load", "won_load", "woff_load", "st_load"], periods
+    )
+    loads = _shared.read_csv(
+        "Loads.csv",
+        ["household_demand", "industrial_demand", "commercial_demand", "heat_demand"],
+        periods,
+    )
+    car_charging = _shared.read_csv("Car_Charging.csv", ["cc_demand"], periods)
+
+    columns = (
+        renewables["pv_load"],
+        renewables["won_load"],
+        renewables["woff_load"],
+        renewables["st_load"],
+        loads["household_demand"],
+        loads["industrial_demand"],
+        loads["commercial_demand"],
+        loads["heat_demand"],
+        car_charging["cc_demand"],
+    )
+    series = np.empty((len(columns), len(renewables)), dtype=np.float64)
+    for row, column in zip(series, columns):
+        row[:] = column
+
+    return series
+
+
+def _profile_flows(carrier, profile, maximum):
+    """Map a load profile onto a component's flow rates and timeseries.
+
+    Parameters
+    ----------
+    carrier : str
+        Name of the flow the load profile is assigned to.
+    profile : numpy.ndarray
+        Load profile fixing the flow's values at each time step.
+    maximum : float
+        The load profile's maximum, used as the flow's maximum flow rate.
+
+    Returns
+    -------
+    dict
+        ``flow_rates`` and ``timeseries`` keyword arguments of a
+        :mod:`tessif.components` component.
+    """
+    return {
+        "flow_rates": {carrier: nts.MinMax(min=0, max=maximum)},
+        "timeseries": {carrier: nts.MinMax(min=profile, max=profile)},
+    }
+
+
+def _create_profiled_components(component, node_type, specs, profiles, maxima):
+    """Create the load profile driven components of a grid focused model.
+
+    Parameters
+    ----------
+    component : type
+        :class:`tessif.components.Source` or :class:`tessif.components.Sink`.
+    node_type : str
+        Node type shared by all created components.
+    specs : tuple
+        Specifications of the created components as
+        :class:`_ProfiledComponent` instances.
+    profiles : _LoadProfiles
+        Load profiles as returned by
+        :func:`tessif_examples.scientific._shared.load_profiles`.
+    maxima : _LoadProfiles
+        Load profile maxima as returned by
+        :func:`tessif_examples.scientific._shared.load_profiles`.
+
+    Returns
+    -------
+    dict
+        Created components keyed by their name.
+    """
+    interface = "outputs" if component is components.Source else "inputs"
+
+    created = {}
+    for spec in specs:
+        created[spec.name] = component(
+            name=spec.name,
+            **{interface: (spec.flow,)},
+            **(_COMMON if spec.located else {}),
+            sector=spec.sector,
+            carrier=spec.carrier,
+            node_type=node_type,
+            **_profile_flows(
+                spec.flow,
+                getattr(profiles, spec.profile),
+                getattr(maxima, spec.profile),
+            ),
+            flow_costs={spec.flow: spec.costs},
+            flow_emissions={spec.flow: 0},
+        )
+
+    return created
+
+
+def _create_balancing_components(component, name, node_type):
+    """Create a balancing component for each of the transformer grid's levels.
+
+    Parameters
+    ----------
+    component : type
+        :class:`tessif.components.Source` or :class:`tessif.components.Sink`.
+    name : str
+        Name prefix of the created components, completed by the grid level's
+        abbreviation.
+    node_type : str
+        Node type shared by all created components.
+
+    Returns
+    -------
+    dict
+        Created components keyed by their name.
+    """
+    interface = "outputs" if component is components.Source else "inputs"
+
+    created = {}
+    for level, carrier in _GRID_LEVELS:
+        created[f"{name} {level}"] = component(
+            name=f"{name} {level}",
+            **{interface: (carrier,)},
+            # Minimum number of arguments required
+            sector="Power",
+            carrier="electricity",
+            node_type=node_type,
+            flow_rates={carrier: _shared.UNBOUNDED},
+            flow_costs={carrier: 300},
+            flow_emissions={carrier: 0.6},
+        )
+
+    return created
+
+
+def _create_grid_transfers(efficiency, capacity, expansion):
+    """Create the transformers connecting the transformer grid's levels.
+
+    Parameters
+    ----------
+    efficiency : float
+        Efficiency of the grid transformers.
+    capacity : float
+        Maximum outflow of the grid transformers.
+    expansion : bool
+        If ``True`` the maximum outflow is subject to expansion.
+
+    Returns
+    -------
+    dict
+        Created components keyed by their name.
+    """
+    expansion_limits = nts.MinMax(min=capacity, max=float("+inf"))
+
+    created = {}
+    for spec in _GRID_TRANSFERS:
+        created[spec.name] = components.Transformer(
+            name=spec.name,
+            inputs=(spec.inflow,),
+            outputs=(spec.outflow,),
+            conversions={(spec.inflow, spec.outflow): efficiency},
+            # Minimum number of arguments required
+            **(_COMMON if spec.located else {}),
+            sector="Power",
+            carrier="electricity",
+            node_type="connector",
+            flow_rates={
+                spec.inflow: _shared.UNBOUNDED,
+                spec.outflow: nts.MinMax(min=0, max=capacity),
+            },
+            flow_costs={spec.inflow: 0, spec.outflow: 10},
+            flow_emissions={spec.inflow: 0, spec.outflow: 0},
+            expandable={spec.inflow: False, spec.outflow: expansion},
+            expansion_costs={spec.inflow: 0, spec.outflow: 10},
+            expansion_limits={
+                spec.inflow: expansion_limits,
+                spec.outflow: expansion_limits,
+            },
+        )
+
+    return created
 
 
 def create_lossless_commitment_msc(periods=24):
@@ -45,77 +402,26 @@ def create_lossless_commitment_msc(periods=24):
         :alt: Image showing the create_hhes energy system graph.
     """
     # 2. Create a simulation time frame as a :class:`pandas.DatetimeIndex`:
-    timeframe = pd.date_range("10/13/2030", periods=periods, freq="H")
+    timeframe = _shared.hourly_timeframe("2030-10-13", periods)
 
     # 3. Parse csv files with the demand and renewables load data:
-    d = os.path.join(data_dir, "load_profiles")
-
-    # solar:
-    pv = pd.read_csv(os.path.join(d, "Renewable_Energy.csv"), index_col=0, sep=";")
-    pv = pv["pv_load"].values.flatten()[0:periods]
-    max_pv = np.max(pv)
-
-    # wind onshore:
-    w_on = pd.read_csv(os.path.join(d, "Renewable_Energy.csv"), index_col=0, sep=";")
-    w_on = w_on["won_load"].values.flatten()[0:periods]
-    max_w_on = np.max(w_on)
-
-    # wind offshore:
-    w_off = pd.read_csv(os.path.join(d, "Renewable_Energy.csv"), index_col=0, sep=";")
-    w_off = w_off["woff_load"].values.flatten()[0:periods]
-    max_w_off = np.max(w_off)
-
-    # solar thermal:
-    s_t = pd.read_csv(os.path.join(d, "Renewable_Energy.csv"), index_col=0, sep=";")
-    s_t = s_t["st_load"].values.flatten()[0:periods]
-    max_s_t = np.max(s_t)
-
-    # household demand
-    h_d = pd.read_csv(os.path.join(d, "Loads.csv"), index_col=0, sep=";")
-    h_d = h_d["household_demand"].values.flatten()[0:periods]
-    max_h_d = np.max(h_d)
-
-    # industrial demand
-    i_d = pd.read_csv(os.path.join(d, "Loads.csv"), index_col=0, sep=";")
-    i_d = i_d["industrial_demand"].values.flatten()[0:periods]
-    max_i_d = np.max(i_d)
-
-    # commercial demand
-    c_d = pd.read_csv(os.path.join(d, "Loads.csv"), index_col=0, sep=";")
-    c_d = c_d["commercial_demand"].values.flatten()[0:periods]
-    max_c_d = np.max(c_d)
-
-    # district heating demand
-    dh_d = pd.read_csv(os.path.join(d, "Loads.csv"), index_col=0, sep=";")
-    dh_d = dh_d["heat_demand"].values.flatten()[0:periods]
-    max_dh_d = np.max(dh_d)
-
-    # car charging demand
-    cc_d = pd.read_csv(os.path.join(d, "Car_Charging.csv"), index_col=0, sep=";")
-    cc_d = cc_d["cc_demand"].values.flatten()[0:periods]
-    max_cc_d = np.max(cc_d)
+    profiles, maxima = _shared.load_profiles(
+        _parse_load_profiles, _LoadProfiles, periods
+    )
 
     # 4. Create the individual energy system components:
-    global_constraints = {
-        "name": "default",
-        "emissions": float("+inf"),
+    profiled_components = {
+        **_create_profiled_components(
+            components.Source, "Renewable", _LOSSLESS_PROFILED_SOURCES, profiles, maxima
+        ),
+        **_create_profiled_components(
+            components.Sink, "demand", _LOSSLESS_PROFILED_SINKS, profiles, maxima
+        ),
     }
+    global_constraints = dict(_GLOBAL_CONSTRAINTS)
 
     # -------------Low Voltage and heat ------------------
 
-    solar_panel = components.Source(
-        name="Solar Panel",
-        outputs=("electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="Electricity",
-        node_type="Renewable",
-        flow_rates={"electricity": nts.MinMax(min=0, max=max_pv)},
-        flow_costs={"electricity": 60.85},
-        flow_emissions={"electricity": 0},
-        timeseries={"electricity": nts.MinMax(min=pv, max=pv)},
-    )
-
     biogas_supply = components.Source(
         name="Biogas plant",
         outputs=("fuel",),
@@ -146,45 +452,6 @@ def create_lossless_commitment_msc(periods=24):
         flow_emissions={"fuel": 0, "electricity": 0.1573, "heat": 0.0732},
     )
 
-    household_demand = components.Sink(
-        name="Household Demand",
-        inputs=("electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="demand",
-        flow_rates={"electricity": nts.MinMax(min=0, max=max_h_d)},
-        flow_costs={"electricity": 0},
-        flow_emissions={"electricity": 0},
-        timeseries={"electricity": nts.MinMax(min=h_d, max=h_d)},
-    )
-
-    commercial_demand = components.Sink(
-        name="Commercial Demand",
-        inputs=("electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="demand",
-        flow_rates={"electricity": nts.MinMax(min=0, max=max_c_d)},
-        flow_costs={"electricity": 0},
-        flow_emissions={"electricity": 0},
-        timeseries={"electricity": nts.MinMax(min=c_d, max=c_d)},
-    )
-
-    heat_demand = components.Sink(
-        name="District Heating Demand",
-        inputs=("heat",),
-        # Minimum number of arguments required
-        sector="Heat",
-        carrier="hot Water",
-        node_type="demand",
-        flow_rates={"heat": nts.MinMax(min=0, max=max_dh_d)},
-        flow_costs={"heat": 0},
-        flow_emissions={"heat": 0},
-        timeseries={"heat": nts.MinMax(min=dh_d, max=dh_d)},
-    )
-
     gas_supply_line = components.Bus(
         name="Gaspipeline",
         inputs=("Gas Station.fuel",),
@@ -244,58 +511,6 @@ def create_lossless_commitment_msc(periods=24):
 
     # ----- -------Medium Voltage and Heat ------------------
 
-    onshore_wind_power = components.Source(
-        name="Onshore Wind Power",
-        outputs=("electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="Electricity",
-        node_type="Renewable",
-        flow_rates={"electricity": nts.MinMax(min=0, max=max_w_on)},
-        flow_costs={"electricity": 61.1},
-        flow_emissions={"electricity": 0},
-        timeseries={"electricity": nts.MinMax(min=w_on, max=w_on)},
-    )
-
-    solar_thermal = components.Source(
-        name="Solar Thermal",
-        outputs=("heat",),
-        # Minimum number of arguments required
-        sector="Heat",
-        carrier="Hot Water",
-        node_type="Renewable",
-        flow_rates={"heat": nts.MinMax(min=0, max=max_s_t)},
-        flow_costs={"heat": 73},
-        flow_emissions={"heat": 0},
-        timeseries={"heat": nts.MinMax(min=s_t, max=s_t)},
-    )
-
-    industrial_demand = components.Sink(
-        name="Industrial Demand",
-        inputs=("electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="demand",
-        flow_rates={"electricity": nts.MinMax(min=0, max=max_i_d)},
-        flow_costs={"electricity": 0},
-        flow_emissions={"electricity": 0},
-        timeseries={"electricity": nts.MinMax(min=i_d, max=i_d)},
-    )
-
-    car_charging_station_demand = components.Sink(
-        name="Car charging Station",
-        inputs=("electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="demand",
-        flow_rates={"electricity": nts.MinMax(min=0, max=max_cc_d)},
-        flow_costs={"electricity": 0},
-        flow_emissions={"electricity": 0},
-        timeseries={"electricity": nts.MinMax(min=cc_d, max=cc_d)},
-    )
-
     power_to_heat = components.Transformer(
         name="Power to Heat",
         inputs=("electricity",),
@@ -338,19 +553,6 @@ def create_lossless_commitment_msc(periods=24):
 
     # ----------------- High Voltage -------------------------
 
-    offshore_wind_power = components.Source(
-        name="Offshore Wind Power",
-        outputs=("electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="Electricity",
-        node_type="Renewable",
-        flow_rates={"electricity": nts.MinMax(min=0, max=max_w_off)},
-        flow_costs={"electricity": 106.4},
-        flow_emissions={"electricity": 0},
-        timeseries={"electricity": nts.MinMax(min=w_off, max=w_off)},
-    )
-
     coal_supply = components.Source(
         name="Coal Supply",
         outputs=("fuel",),
@@ -370,7 +572,7 @@ def create_lossless_commitment_msc(periods=24):
         sector="Power",
         carrier="Gas",
         node_type="source",
-        flow_rates={"fuel": nts.MinMax(min=0, max=float("+inf"))},
+        flow_rates={"fuel": _shared.UNBOUNDED},
         flow_costs={"fuel": 0},
         flow_emissions={"fuel": 0},
     )
@@ -466,44 +668,50 @@ def create_lossless_commitment_msc(periods=24):
     )
 
     # 4. Create the actual energy system:
+    busses = (
+        gas_supply_line,
+        low_electricity_line,
+        heat_line,
+        medium_electricity_line,
+        high_electricity_line,
+        coal_supply_line,
+        biogas_supply_line,
+    )
+    sinks = (
+        profiled_components["Household Demand"],
+        profiled_components["Commercial Demand"],
+        profiled_components["District Heating Demand"],
+        profiled_components["Industrial Demand"],
+        profiled_components["Car charging Station"],
+    )
+    sources = (
+        profiled_components["Solar Panel"],
+        gas_supply,
+        profiled_components["Onshore Wind Power"],
+        profiled_components["Offshore Wind Power"],
+        coal_supply,
+        profiled_components["Solar Thermal"],
+        biogas_supply,
+    )
+    transformers = (
+        bhkw_generator,
+        power_to_heat,
+        gud_generator,
+        hkw_generator,
+        hkw_generator_2,
+    )
+    connectors = (
+        low_medium_transformator,
+        high_medium_transformator,
+    )
+
     es = system_model.AbstractEnergySystem(
         uid="Grid Focused Lossless Commitment Problem",
-        busses=(
-            gas_supply_line,
-            low_electricity_line,
-            heat_line,
-            medium_electricity_line,
-            high_electricity_line,
-            coal_supply_line,
-            biogas_supply_line,
-        ),
-        sinks=(
-            household_demand,
-            commercial_demand,
-            heat_demand,
-            industrial_demand,
-            car_charging_station_demand,
-        ),
-        sources=(
-            solar_panel,
-            gas_supply,
-            onshore_wind_power,
-            offshore_wind_power,
-            coal_supply,
-            solar_thermal,
-            biogas_supply,
-        ),
-        transformers=(
-            bhkw_generator,
-            power_to_heat,
-            gud_generator,
-            hkw_generator,
-            hkw_generator_2,
-        ),
-        connectors=(
-            low_medium_transformator,
-            high_medium_transformator,
-        ),
+        busses=busses,
+        sinks=sinks,
+        sources=sources,
+        transformers=transformers,
+        connectors=connectors,
         timeframe=timeframe,
         global_constraints=global_constraints,
     )
@@ -571,91 +779,43 @@ def create_transformer_grid_focused_msc(
         :alt: Image showing the TransCnE GSV.
     """
     # 2. Create a simulation time frame as a :class:`pandas.DatetimeIndex`:
-    timeframe = pd.date_range("10/13/2030", periods=periods, freq="H")
+    timeframe = _shared.hourly_timeframe("2030-10-13", periods)
 
     # 3. Parse csv files with the demand and renewables load data:
-    d = os.path.join(data_dir, "load_profiles")
-
-    # solar:
-    pv = pd.read_csv(os.path.join(d, "Renewable_Energy.csv"), index_col=0, sep=";")
-    pv = pv["pv_load"].values.flatten()[0:periods]
-    max_pv = np.max(pv)
-
-    # wind onshore:
-    w_on = pd.read_csv(os.path.join(d, "Renewable_Energy.csv"), index_col=0, sep=";")
-    w_on = w_on["won_load"].values.flatten()[0:periods]
-    max_w_on = np.max(w_on)
-
-    # wind offshore:
-    w_off = pd.read_csv(os.path.join(d, "Renewable_Energy.csv"), index_col=0, sep=";")
-    w_off = w_off["woff_load"].values.flatten()[0:periods]
-    max_w_off = np.max(w_off)
-
-    # solar thermal:
-    s_t = pd.read_csv(os.path.join(d, "Renewable_Energy.csv"), index_col=0, sep=";")
-    s_t = s_t["st_load"].values.flatten()[0:periods]
-    max_s_t = np.max(s_t)
-
-    # household demand
-    h_d = pd.read_csv(os.path.join(d, "Loads.csv"), index_col=0, sep=";")
-    h_d = h_d["household_demand"].values.flatten()[0:periods]
-    max_h_d = np.max(h_d)
-
-    # industrial demand
-    i_d = pd.read_csv(os.path.join(d, "Loads.csv"), index_col=0, sep=";")
-    i_d = i_d["industrial_demand"].values.flatten()[0:periods]
-    max_i_d = np.max(i_d)
-
-    # commercial demand
-    c_d = pd.read_csv(os.path.join(d, "Loads.csv"), index_col=0, sep=";")
-    c_d = c_d["commercial_demand"].values.flatten()[0:periods]
-    max_c_d = np.max(c_d)
-
-    # district heating demand
-    dh_d = pd.read_csv(os.path.join(d, "Loads.csv"), index_col=0, sep=";")
-    dh_d = dh_d["heat_demand"].values.flatten()[0:periods]
-    max_dh_d = np.max(dh_d)
-
-    # car charging demand
-    cc_d = pd.read_csv(os.path.join(d, "Car_Charging.csv"), index_col=0, sep=";")
-    cc_d = cc_d["cc_demand"].values.flatten()[0:periods]
-    max_cc_d = np.max(cc_d)
+    profiles, maxima = _shared.load_profiles(
+        _parse_load_profiles, _LoadProfiles, periods
+    )
 
     # 4. Create the individual energy system components:
-    global_constraints = {
-        "name": "default",
-        "emissions": float("+inf"),
+    profiled_components = {
+        **_create_profiled_components(
+            components.Source,
+            "Renewable",
+            _TRANSFORMER_GRID_PROFILED_SOURCES,
+            profiles,
+            maxima,
+        ),
+        **_create_profiled_components(
+            components.Sink,
+            "demand",
+            _TRANSFORMER_GRID_PROFILED_SINKS,
+            profiles,
+            maxima,
+        ),
     }
+    global_constraints = dict(_GLOBAL_CONSTRAINTS)
 
     # -------------Low Voltage and heat ------------------
 
-    solar_panel = components.Source(
-        name="Solar Panel",
-        outputs=("low-voltage-electricity",),
-        # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
-        sector="Power",
-        carrier="low-voltage-electricity",
-        node_type="Renewable",
-        flow_rates={"low-voltage-electricity": nts.MinMax(min=0, max=max_pv)},
-        flow_costs={"low-voltage-electricity": 60.85},
-        flow_emissions={"low-voltage-electricity": 0},
-        timeseries={"low-voltage-electricity": nts.MinMax(min=pv, max=pv)},
-    )
-
     gas_supply = components.Source(
         name="Gas Station",
         outputs=("fuel",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="Gas",
         node_type="source",
-        flow_rates={"fuel": nts.MinMax(min=0, max=float("+inf"))},
+        flow_rates={"fuel": _shared.UNBOUNDED},
         flow_costs={"fuel": 0},
         flow_emissions={"fuel": 0},
         timeseries=None,
@@ -665,9 +825,7 @@ def create_transformer_grid_focused_msc(
         name="Biogas plant",
         outputs=("fuel",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Coupled",
         carrier="Gas",
         node_type="source",
@@ -702,48 +860,6 @@ def create_transformer_grid_focused_msc(
         },
     )
 
-    household_demand = components.Sink(
-        name="Household Demand",
-        inputs=("low-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="low-voltage-electricity",
-        node_type="demand",
-        flow_rates={"low-voltage-electricity": nts.MinMax(min=0, max=max_h_d)},
-        flow_costs={"low-voltage-electricity": 0},
-        flow_emissions={"low-voltage-electricity": 0},
-        timeseries={"low-voltage-electricity": nts.MinMax(min=h_d, max=h_d)},
-    )
-
-    commercial_demand = components.Sink(
-        name="Commercial Demand",
-        inputs=("low-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="low-voltage-electricity",
-        node_type="demand",
-        flow_rates={"low-voltage-electricity": nts.MinMax(min=0, max=max_c_d)},
-        flow_costs={"low-voltage-electricity": 0},
-        flow_emissions={"low-voltage-electricity": 0},
-        timeseries={"low-voltage-electricity": nts.MinMax(min=c_d, max=c_d)},
-    )
-
-    heat_demand = components.Sink(
-        name="District Heating Demand",
-        inputs=("heat",),
-        # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
-        sector="Heat",
-        carrier="hot Water",
-        node_type="demand",
-        flow_rates={"heat": nts.MinMax(min=0, max=max_dh_d)},
-        flow_costs={"heat": 0},
-        flow_emissions={"heat": 0},
-        timeseries={"heat": nts.MinMax(min=dh_d, max=dh_d)},
-    )
-
     gas_supply_line = components.Bus(
         name="Gaspipeline",
         inputs=("Gas Station.fuel",),
@@ -801,58 +917,6 @@ def create_transformer_grid_focused_msc(
 
     # ----- -------Medium Voltage and Heat ------------------
 
-    onshore_wind_power = components.Source(
-        name="Onshore Wind Power",
-        outputs=("medium-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="power",
-        carrier="medium-voltage-electricity",
-        node_type="Renewable",
-        flow_rates={"medium-voltage-electricity": nts.MinMax(min=0, max=max_w_on)},
-        flow_costs={"medium-voltage-electricity": 61.1},
-        flow_emissions={"medium-voltage-electricity": 0},
-        timeseries={"medium-voltage-electricity": nts.MinMax(min=w_on, max=w_on)},
-    )
-
-    solar_thermal = components.Source(
-        name="Solar Thermal",
-        outputs=("heat",),
-        # Minimum number of arguments required
-        sector="Heat",
-        carrier="Hot Water",
-        node_type="Renewable",
-        flow_rates={"heat": nts.MinMax(min=0, max=max_s_t)},
-        flow_costs={"heat": 73},
-        flow_emissions={"heat": 0},
-        timeseries={"heat": nts.MinMax(min=s_t, max=s_t)},
-    )
-
-    industrial_demand = components.Sink(
-        name="Industrial Demand",
-        inputs=("medium-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="medium-voltage-electricity",
-        node_type="demand",
-        flow_rates={"medium-voltage-electricity": nts.MinMax(min=0, max=max_i_d)},
-        flow_costs={"medium-voltage-electricity": 0},
-        flow_emissions={"medium-voltage-electricity": 0},
-        timeseries={"medium-voltage-electricity": nts.MinMax(min=i_d, max=i_d)},
-    )
-
-    car_charging_station_demand = components.Sink(
-        name="Car charging Station",
-        inputs=("medium-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="medium-voltage-electricity",
-        node_type="demand",
-        flow_rates={"medium-voltage-electricity": nts.MinMax(min=0, max=max_cc_d)},
-        flow_costs={"medium-voltage-electricity": 0},
-        flow_emissions={"medium-voltage-electricity": 0},
-        timeseries={"medium-voltage-electricity": nts.MinMax(min=cc_d, max=cc_d)},
-    )
-
     power_to_heat = components.Transformer(
         name="Power to Heat",
         inputs=("medium-voltage-electricity",),
@@ -862,8 +926,8 @@ def create_transformer_grid_focused_msc(
         carrier="Hot Water",
         node_type="transformer",
         flow_rates={
-            "medium-voltage-electricity": nts.MinMax(min=0, max=float("+inf")),
-            "heat": nts.MinMax(min=0, max=float("+inf")),
+            "medium-voltage-electricity": _shared.UNBOUNDED,
+            "heat": _shared.UNBOUNDED,
         },
         flow_costs={"medium-voltage-electricity": 0, "heat": 0},
         flow_emissions={"medium-voltage-electricity": 0, "heat": 0},
@@ -893,19 +957,6 @@ def create_transformer_grid_focused_msc(
 
     # ----------------- High Voltage -------------------------
 
-    offshore_wind_power = components.Source(
-        name="Offshore Wind Power",
-        outputs=("high-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="high-voltage-electricity",
-        node_type="Renewable",
-        flow_rates={"high-voltage-electricity": nts.MinMax(min=0, max=max_w_off)},
-        flow_costs={"high-voltage-electricity": 106.4},
-        flow_emissions={"high-voltage-electricity": 0},
-        timeseries={"high-voltage-electricity": nts.MinMax(min=w_off, max=w_off)},
-    )
-
     coal_supply = components.Source(
         name="Coal Supply",
         outputs=("fuel",),
@@ -1013,296 +1064,15 @@ def create_transformer_grid_focused_msc(
     )
 
     # Gridstructure and Transformer
-
-    low_medium_transformator = components.Transformer(
-        name="Low Medium Transfer",
-        inputs=("low-voltage-electricity",),
-        outputs=("medium-voltage-electricity",),
-        conversions={
-            (
-                "low-voltage-electricity",
-                "medium-voltage-electricity",
-            ): transformer_efficiency
-        },
-        # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
-        sector="Power",
-        carrier="electricity",
-        node_type="connector",
-        flow_rates={
-            "low-voltage-electricity": nts.MinMax(
-                min=0,
-                max=float("+inf"),
-            ),
-            "medium-voltage-electricity": nts.MinMax(
-                min=0,
-                max=gridcapacity,
-            ),
-        },
-        flow_costs={
-            "low-voltage-electricity": 0,
-            "medium-voltage-electricity": 10,
-        },
-        flow_emissions={"low-voltage-electricity": 0, "medium-voltage-electricity": 0},
-        expandable={
-            "low-voltage-electricity": False,
-            "medium-voltage-electricity": expansion,
-        },
-        expansion_costs={
-            "low-voltage-electricity": 0,
-            "medium-voltage-electricity": 10,
-        },
-        expansion_limits={
-            "low-voltage-electricity": nts.MinMax(
-                min=gridcapacity,
-                max=float("+inf"),
-            ),
-            "medium-voltage-electricity": nts.MinMax(
-                min=gridcapacity,
-                max=float("+inf"),
-            ),
-        },
+    grid_transfers = _create_grid_transfers(
+        transformer_efficiency, gridcapacity, expansion
     )
 
-    medium_low_transformator = components.Transformer(
-        name="Medium Low Transfer",
-        inputs=("medium-voltage-electricity",),
-        outputs=("low-voltage-electricity",),
-        conversions={
-            (
-                "medium-voltage-electricity",
-                "low-voltage-electricity",
-            ): transformer_efficiency
-        },
-        # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
-        sector="Power",
-        carrier="electricity",
-        node_type="connector",
-        flow_rates={
-            "medium-voltage-electricity": nts.MinMax(
-                min=0,
-                max=float("+inf"),
-            ),
-            "low-voltage-electricity": nts.MinMax(
-                min=0,
-                max=gridcapacity,
-            ),
-        },
-        flow_costs={
-            "medium-voltage-electricity": 0,
-            "low-voltage-electricity": 10,
-        },
-        flow_emissions={
-            "low-voltage-electricity": 0,
-            "medium-voltage-electricity": 0,
-        },
-        expandable={
-            "medium-voltage-electricity": False,
-            "low-voltage-electricity": expansion,
-        },
-        expansion_costs={
-            "medium-voltage-electricity": 0,
-            "low-voltage-electricity": 10,
-        },
-        expansion_limits={
-            "medium-voltage-electricity": nts.MinMax(
-                min=gridcapacity,
-                max=float("+inf"),
-            ),
-            "low-voltage-electricity": nts.MinMax(
-                min=gridcapacity,
-                max=float("+inf"),
-            ),
-        },
-    )
-
-    medium_high_transformator = components.Transformer(
-        name="Medium High Transfer",
-        inputs=("medium-voltage-electricity",),
-        outputs=("high-voltage-electricity",),
-        conversions={
-            (
-                "medium-voltage-electricity",
-                "high-voltage-electricity",
-            ): transformer_efficiency
-        },
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="connector",
-        flow_rates={
-            "medium-voltage-electricity": nts.MinMax(
-                min=0,
-                max=float("+inf"),
-            ),
-            "high-voltage-electricity": nts.MinMax(
-                min=0,
-                max=gridcapacity,
-            ),
-        },
-        flow_costs={
-            "medium-voltage-electricity": 0,
-            "high-voltage-electricity": 10,
-        },
-        flow_emissions={
-            "medium-voltage-electricity": 0,
-            "high-voltage-electricity": 0,
-        },
-        expandable={
-            "medium-voltage-electricity": False,
-            "high-voltage-electricity": expansion,
-        },
-        expansion_costs={
-            "medium-voltage-electricity": 0,
-            "high-voltage-electricity": 10,
-        },
-        expansion_limits={
-            "medium-voltage-electricity": nts.MinMax(
-                min=gridcapacity,
-                max=float("+inf"),
-            ),
-            "high-voltage-electricity": nts.MinMax(
-                min=gridcapacity,
-                max=float("+inf"),
-            ),
-        },
-    )
-
-    high_medium_transformator = components.Transformer(
-        name="High Medium Transfer",
-        inputs=("high-voltage-electricity",),
-        outputs=("medium-voltage-electricity",),
-        conversions={
-            (
-                "high-voltage-electricity",
-                "medium-voltage-electricity",
-            ): transformer_efficiency
-        },
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="connector",
-        flow_rates={
-            "high-voltage-electricity": nts.MinMax(
-                min=0,
-                max=float("+inf"),
-            ),
-            "medium-voltage-electricity": nts.MinMax(
-                min=0,
-                max=gridcapacity,
-            ),
-        },
-        flow_costs={
-            "high-voltage-electricity": 0,
-            "medium-voltage-electricity": 10,
-        },
-        flow_emissions={
-            "high-voltage-electricity": 0,
-            "medium-voltage-electricity": 0,
-        },
-        expandable={
-            "high-voltage-electricity": False,
-            "medium-voltage-electricity": expansion,
-        },
-        expansion_costs={
-            "high-voltage-electricity": 0,
-            "medium-voltage-electricity": 10,
-        },
-        expansion_limits={
-            "high-voltage-electricity": nts.MinMax(
-                min=gridcapacity,
-                max=float("+inf"),
-            ),
-            "medium-voltage-electricity": nts.MinMax(
-                min=gridcapacity,
-                max=float("+inf"),
-            ),
-        },
-    )
-
-    # ---------- Deficit Sources ---------------
-
-    power_source_lv = components.Source(
-        name="Deficit Source LV",
-        outputs=("low-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="source",
-        flow_rates={"low-voltage-electricity": nts.MinMax(min=0, max=float("+inf"))},
-        flow_costs={"low-voltage-electricity": 300},
-        flow_emissions={"low-voltage-electricity": 0.6},
-    )
-
-    power_source_mv = components.Source(
-        name="Deficit Source MV",
-        outputs=("medium-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="source",
-        flow_rates={
-            "medium-voltage-electricity": nts.MinMax(min=0, max=float("+inf")),
-        },
-        flow_costs={"medium-voltage-electricity": 300},
-        flow_emissions={"medium-voltage-electricity": 0.6},
-    )
-
-    power_source_hv = components.Source(
-        name="Deficit Source HV",
-        outputs=("high-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="source",
-        flow_rates={"high-voltage-electricity": nts.MinMax(min=0, max=float("+inf"))},
-        flow_costs={"high-voltage-electricity": 300},
-        flow_emissions={"high-voltage-electricity": 0.6},
-    )
-
-    power_sink_lv = components.Sink(
-        name="Excess Sink LV",
-        inputs=("low-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="sink",
-        flow_rates={"low-voltage-electricity": nts.MinMax(min=0, max=float("+inf"))},
-        flow_costs={"low-voltage-electricity": 300},
-        flow_emissions={"low-voltage-electricity": 0.6},
-    )
-
-    # ------------------- Excess Sinks --------------------------
-    power_sink_mv = components.Sink(
-        name="Excess Sink MV",
-        inputs=("medium-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="sink",
-        flow_rates={
-            "medium-voltage-electricity": nts.MinMax(min=0, max=float("+inf")),
-        },
-        flow_costs={"medium-voltage-electricity": 300},
-        flow_emissions={"medium-voltage-electricity": 0.6},
-    )
-
-    power_sink_hv = components.Sink(
-        name="Excess Sink HV",
-        inputs=("high-voltage-electricity",),
-        # Minimum number of arguments required
-        sector="Power",
-        carrier="electricity",
-        node_type="sink",
-        flow_rates={"high-voltage-electricity": nts.MinMax(min=0, max=float("+inf"))},
-        flow_costs={"high-voltage-electricity": 300},
-        flow_emissions={"high-voltage-electricity": 0.6},
-    )
+    # ---------- Deficit Sources and Excess Sinks ---------------
+    balancing_components = {
+        **_create_balancing_components(components.Source, "Deficit Source", "source"),
+        **_create_balancing_components(components.Sink, "Excess Sink", "sink"),
+    }
 
     # 4. Create the actual energy system:
     if expansion:
@@ -1312,50 +1082,55 @@ def create_transformer_grid_focused_msc(
         # uid = "TransC"
         uid = "Transformer Grid Focused MSC (Commitment Problem)"
 
+    busses = (
+        gas_supply_line,
+        low_electricity_line,
+        heat_line,
+        medium_electricity_line,
+        high_electricity_line,
+        coal_supply_line,
+        biogas_supply_line,
+    )
+    sinks = (
+        profiled_components["Household Demand"],
+        profiled_components["Commercial Demand"],
+        profiled_components["District Heating Demand"],
+        profiled_components["Industrial Demand"],
+        profiled_components["Car charging Station"],
+        balancing_components["Excess Sink LV"],
+        balancing_components["Excess Sink MV"],
+        balancing_components["Excess Sink HV"],
+    )
+    sources = (
+        profiled_components["Solar Panel"],
+        profiled_components["Offshore Wind Power"],
+        profiled_components["Onshore Wind Power"],
+        gas_supply,
+        coal_supply,
+        profiled_components["Solar Thermal"],
+        biogas_supply,
+        balancing_components["Deficit Source LV"],
+        balancing_components["Deficit Source MV"],
+        balancing_components["Deficit Source HV"],
+    )
+    transformers = (
+        bhkw_generator,
+        power_to_heat,
+        gud_generator,
+        hkw_generator,
+        grid_transfers["High Medium Transfer"],
+        grid_transfers["Low Medium Transfer"],
+        grid_transfers["Medium Low Transfer"],
+        grid_transfers["Medium High Transfer"],
+        hkw_generator_2,
+    )
+
     es = system_model.AbstractEnergySystem(
         uid=uid,
-        busses=(
-            gas_supply_line,
-            low_electricity_line,
-            heat_line,
-            medium_electricity_line,
-            high_electricity_line,
-            coal_supply_line,
-            biogas_supply_line,
-        ),
-        sinks=(
-            household_demand,
-            commercial_demand,
-            heat_demand,
-            industrial_demand,
-            car_charging_station_demand,
-            power_sink_lv,
-            power_sink_mv,
-            power_sink_hv,
-        ),
-        sources=(
-            solar_panel,
-            offshore_wind_power,
-            onshore_wind_power,
-            gas_supply,
-            coal_supply,
-            solar_thermal,
-            biogas_supply,
-            power_source_lv,
-            power_source_mv,
-            power_source_hv,
-        ),
-        transformers=(
-            bhkw_generator,
-            power_to_heat,
-            gud_generator,
-            hkw_generator,
-            high_medium_transformator,
-            low_medium_transformator,
-            medium_low_transformator,
-            medium_high_transformator,
-            hkw_generator_2,
-        ),
+        busses=busses,
+        sinks=sinks,
+        sources=sources,
+        transformers=transformers,
         timeframe=timeframe,
         global_constraints=global_constraints,
     )
@@ -3,15 +3,295 @@
 # pylint: disable=duplicate-code
 # pylint: disable=too-many-lines
 """Grid-focused lossless commitment problem - tessif system model example."""
-import os
+import collections
 
 import numpy as np
-import pandas as pd
 import tessif.frused.namedtuples as nts
 from tessif import components, system_model
 
 from tessif_examples import utils
-from tessif_examples.paths import data_dir
+from tessif_examples.scientific import _shared
+
+_PV_ANNUITY = utils.annuity(capex=1000000, n=20, wacc=0.05)
+"""Annual expansion costs of the hamburg inspired model's solar panels."""
+
+_WIND_ANNUITY = utils.annuity(capex=1750000, n=20, wacc=0.05)
+"""Annual expansion costs of the hamburg inspired model's onshore wind."""
+
+_STORAGE_ANNUITY = utils.annuity(capex=1000000, n=10, wacc=0.05)
+"""Annual expansion costs of the hamburg inspired model's storage capacity."""
+
+_P2H_ANNUITY = utils.annuity(capex=200000, n=30, wacc=0.05)
+"""Annual expansion costs of the hamburg inspired model's power to heat."""
+
+_PowerPlant = collections.namedtuple(
+    "_PowerPlant",
+    [
+        "name",
+        "node_type",
+        "fuel",
+        "sector",
+        "latitude",
+        "longitude",
+        "region",
+        "electricity",
+        "status_inertia",
+        "status_changing_costs",
+        "hot_water",
+    ],
+    defaults=(None,),
+)
+
+_PowerPlantOutput = collections.namedtuple(
+    "_PowerPlantOutput", ["efficiency", "maximum", "costs", "emissions"], defaults=(0,)
+)
+
+# Emissions of the chps are attributed to their fuel's supply, so pypsa can
+# handle them better.
+_POWER_PLANTS = (
+    # HKW ADM:
+    _PowerPlant(
+        "chp1",
+        "HKW ADM",
+        "gas",
+        "coupled",
+        53.51,
+        9.94985,
+        "HH",
+        electricity=_PowerPlantOutput(0.3773, float("+inf"), 90),
+        status_inertia=nts.OnOff(0, 1),
+        status_changing_costs=nts.OnOff(24, 0),
+        hot_water=_PowerPlantOutput(0.3, float("+inf"), 21.6),
+    ),
+    # HKW Moorburg:
+    _PowerPlant(
+        "pp1",
+        "HKW Moorburg Block A",
+        "coal",
+        "power",
+        53.489,
+        9.949,
+        "HH",
+        electricity=_PowerPlantOutput(0.4625, 784, 82, 0.34 / 0.4625),
+        status_inertia=nts.OnOff(0, 7),
+        status_changing_costs=nts.OnOff(49, 0),
+    ),
+    _PowerPlant(
+        "pp2",
+        "HKW Moorburg Block B",
+        "coal",
+        "power",
+        53.489,
+        9.949,
+        "HH",
+        electricity=_PowerPlantOutput(0.4625, 784, 82, 0.34 / 0.4625),
+        status_inertia=nts.OnOff(0, 7),
+        status_changing_costs=nts.OnOff(49, 0),
+    ),
+    # HKW Tiefstack:
+    _PowerPlant(
+        "chp2",
+        "HKW Tiefstack GuD",
+        "gas",
+        "coupled",
+        53.53,
+        10.07,
+        "HH",
+        electricity=_PowerPlantOutput(0.585, 123, 90),
+        status_inertia=nts.OnOff(0, 5),
+        status_changing_costs=nts.OnOff(40, 0),
+        hot_water=_PowerPlantOutput(0.40, 180, 18.9),
+    ),
+    _PowerPlant(
+        "chp3",
+        "HKW Tiefstack Block 2",
+        "coal",
+        "coupled",
+        53.53,
+        10.06,
+        "HH",
+        electricity=_PowerPlantOutput(0.4075, 188, 82),
+        status_inertia=nts.OnOff(0, 7),
+        status_changing_costs=nts.OnOff(49, 0),
+        hot_water=_PowerPlantOutput(0.40, 293, 19.68),
+    ),
+    # Wedel GT:
+    _PowerPlant(
+        "pp3",
+        "Wedel GT A",
+        "oil",
+        "power",
+        53.5662,
+        9.72864,
+        "SH",
+        electricity=_PowerPlantOutput(0.3072, 50.5, 90, 0.28 / 0.3072),
+        status_inertia=nts.OnOff(0, 9),
+        status_changing_costs=nts.OnOff(45, 0),
+    ),
+    _PowerPlant(
+        "pp4",
+        "Wedel GT B",
+        "oil",
+        "power",
+        53.5662,
+        9.72864,
+        "SH",
+        electricity=_PowerPlantOutput(0.3072, 50.5, 90, 0.28 / 0.3072),
+        status_inertia=nts.OnOff(0, 9),
+        status_changing_costs=nts.OnOff(45, 0),
+    ),
+    # HKW Wedel:
+    _PowerPlant(
+        "chp4",
+        "HKW Wedel Block 1",
+        "coal",
+        "coupled",
+        53.5667,
+        9.72864,
+        "SH",
+        electricity=_PowerPlantOutput(0.4075, 130, 82),
+        status_inertia=nts.OnOff(0, 7),
+        status_changing_costs=nts.OnOff(49, 0),
+        hot_water=_PowerPlantOutput(0.40, 130, 19.68),
+    ),
+    _PowerPlant(
+        "chp5",
+        "HKW Wedel Block 2",
+        "coal",
+        "coupled",
+        53.5667,
+        9.72864,
+        "SH",
+        electricity=_PowerPlantOutput(0.4075, 118, 82),
+        status_inertia=nts.OnOff(0, 7),
+        status_changing_costs=nts.OnOff(49, 0),
+        hot_water=_PowerPlantOutput(0.40, 88, 19.68),
+    ),
+    # MVR Waste Combustion Rugenberger Damm:
+    _PowerPlant(
+        "chp6",
+        "MVR Müllverwertung Rugenberger Damm",
+        "waste",
+        "coupled",
+        53.52111,
+        9.93339,
+        "HH",
+        electricity=_PowerPlantOutput(0.06, 24, 82),
+        status_inertia=nts.OnOff(0, 9),
+        status_changing_costs=nts.OnOff(40, 0),
+        hot_water=_PowerPlantOutput(0.15, 70, 20),
+    ),
+)
+
+_LoadProfiles = collections.namedtuple("_LoadProfiles", ["pv", "wo", "de", "th"])
+
+
+def _read_profile(filename, column, periods):
+    """Parse the first ``periods`` values of a load profiles csv file column.
+
+    Uses :func:`tessif_examples.scientific._shared.read_csv`.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the csv file inside the load profiles data directory.
+    column : str
+        Name of the parsed column.
+    periods : int
+        Number of rows parsed.
+
+    Returns
+    -------
+    numpy.ndarray
+        Parsed load profile.
+    """
+    data = _shared.read_csv(filename, [column], periods)
+    return data[column].to_numpy(copy=False)
+
+
+def _parse_load_profiles(periods):
+    """Parse the hamburg inspired model's solar, wind and demand profiles.
+
+    Used through :func:`tessif_examples.scientific._shared.load_profiles`.
+
+    Parameters
+    ----------
+    periods : int
+        Number of rows parsed from each csv file.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array holding the solar, onshore wind, electricity demand and heat
+        demand load profiles as rows.
+    """
+    return np.stack(
+        (
+            _read_profile("solar_HH_2019.csv", "0", periods),
+            _read_profile("wind_HH_2019.csv", "0", periods),
+            _read_profile("el_demand_HH_2019.csv", "Last (MW)", periods),
+            _read_profile("th_demand_HH_2019.csv", "actual_total_load", periods),
+        )
+    )
+
+
+def _create_power_plants(initial_status, costs_for_being_active):
+    """Create the hamburg inspired model's fuel fired power plants.
+
+    Parameters
+    ----------
+    initial_status : bool
+        Status of the power plants at the first time step.
+    costs_for_being_active : float
+        Costs of each time step a power plant is active.
+
+    Returns
+    -------
+    dict
+        Created transformers keyed by their name.
+    """
+    created = {}
+    for spec in _POWER_PLANTS:
+        outputs = {"electricity": spec.electricity}
+        if spec.hot_water is not None:
+            outputs["hot_water"] = spec.hot_water
+
+        created[spec.name] = components.Transformer(
+            name=spec.name,
+            inputs=(spec.fuel,),
+            outputs=tuple(outputs),
+            conversions={
+                (spec.fuel, output): flow.efficiency for output, flow in outputs.items()
+            },
+            latitude=spec.latitude,
+            longitude=spec.longitude,
+            region=spec.region,
+            node_type=spec.node_type,
+            component="transformer",
+            sector=spec.sector,
+            carrier=spec.fuel,
+            flow_rates={
+                spec.fuel: _shared.UNBOUNDED,
+                **{
+                    output: nts.MinMax(min=0, max=flow.maximum)
+                    for output, flow in outputs.items()
+                },
+            },
+            flow_costs={
+                spec.fuel: 0,
+                **{output: flow.costs for output, flow in outputs.items()},
+            },
+            flow_emissions={
+                spec.fuel: 0,
+                **{output: flow.emissions for output, flow in outputs.items()},
+            },
+            initial_status=initial_status,
+            status_inertia=spec.status_inertia,
+            status_changing_costs=spec.status_changing_costs,
+            costs_for_being_active=costs_for_being_active,
+        )
+
+    return created
 
 
 def create_hamburg_inspired_hnp_msc(periods=24):
@@ -44,40 +324,14 @@ def create_hamburg_inspired_hnp_msc(periods=24):
 
     """
     # 2. Create a simulation time frame as a :class:`pandas.DatetimeIndex`:
-    timeframe = pd.date_range("2019-01-01", periods=periods, freq="H")
+    timeframe = _shared.hourly_timeframe("2019-01-01", periods)
 
     # 3. Parse csv files with the demand and renewables load data:
-    data_directory = os.path.join(data_dir, "load_profiles")
-
-    # solar:
-    pv_hh = pd.read_csv(
-        os.path.join(data_directory, "solar_HH_2019.csv"), index_col=0, sep=";"
-    )
-    pv_hh = pv_hh.values.flatten()[0:periods]
-    max_pv = np.max(pv_hh)
-
-    # wind onshore:
-    wo_hh = pd.read_csv(
-        os.path.join(data_directory, "wind_HH_2019.csv"), index_col=0, sep=";"
-    )
-    wo_hh = wo_hh.values.flatten()[0:periods]
-    max_wo = np.max(wo_hh)
-
-    # electricity demand:
-    de_hh = pd.read_csv(
-        os.path.join(data_directory, "el_demand_HH_2019.csv"), index_col=0, sep=";"
-    )
-    de_hh = de_hh["Last (MW)"].values.flatten()[0:periods]
-    de_hh = np.array(de_hh)
-    max_de = np.max(de_hh)
-
-    # heat demand:
-    th_hh = pd.read_csv(
-        os.path.join(data_directory, "th_demand_HH_2019.csv"), index_col=0, sep=";"
+    profiles, maxima = _shared.load_profiles(
+        _parse_load_profiles, _LoadProfiles, periods
     )
-    th_hh = th_hh["actual_total_load"].values.flatten()[0:periods]
-    th_hh = np.array(th_hh)
-    max_th = np.max(th_hh)
+    pv_hh, wo_hh, de_hh, th_hh = profiles
+    max_pv, max_wo, max_de, max_th = maxima
 
     # 4. Create the individual energy system components:
     in_stat = False
@@ -135,355 +389,8 @@ def create_hamburg_inspired_hnp_msc(periods=24):
         flow_emissions={"waste": 0.0426},
     )
 
-    # HKW ADM:
-
-    chp1 = components.Transformer(
-        name="chp1",
-        inputs=("gas",),
-        outputs=("electricity", "hot_water"),
-        conversions={
-            ("gas", "electricity"): 0.3773,
-            ("gas", "hot_water"): 0.3,
-        },  # conventional_power_plants_DE.xls
-        latitude=53.51,
-        longitude=9.94985,
-        region="HH",
-        node_type="HKW ADM",
-        component="transformer",
-        sector="coupled",
-        carrier="gas",
-        flow_rates={
-            "gas": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=float("+inf")),  # 6.75
-            "hot_water": nts.MinMax(min=0, max=float("+inf")),
-        },
-        flow_costs={"gas": 0, "electricity": 90, "hot_water": 21.6},
-        # emissions are attributed to gas supply
-        # so pypsa can handle them better
-        flow_emissions={
-            "gas": 0,  # 0.2,
-            "electricity": 0,  # 0.2/0.3773,
-            "hot_water": 0,
-        },  # 0.2/0.3},
-        initial_status=in_stat,
-        status_inertia=nts.OnOff(0, 1),
-        status_changing_costs=nts.OnOff(24, 0),
-        costs_for_being_active=cfba,
-    )
-
-    # HKW Moorburg:
-
-    pp1 = components.Transformer(
-        name="pp1",
-        inputs=("coal",),
-        outputs=("electricity",),
-        conversions={("coal", "electricity"): 0.4625},
-        latitude=53.489,
-        longitude=9.949,
-        region="HH",
-        node_type="HKW Moorburg Block A",
-        component="transformer",
-        sector="power",
-        carrier="coal",
-        flow_rates={
-            "coal": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=784),  # 296
-        },
-        flow_costs={"coal": 0, "electricity": 82},
-        flow_emissions={"coal": 0, "electricity": 0.34 / 0.4625},  # 0.34,
-        initial_status=in_stat,
-        status_inertia=nts.OnOff(0, 7),
-        status_changing_costs=nts.OnOff(49, 0),
-        costs_for_being_active=cfba,
-    )
-
-    pp2 = components.Transformer(
-        name="pp2",
-        inputs=("coal",),
-        outputs=("electricity",),
-        conversions={("coal", "electricity"): 0.4625},
-        latitude=53.489,
-        longitude=9.949,
-        region="HH",
-        node_type="HKW Moorburg Block B",
-        component="transformer",
-        sector="power",
-        carrier="coal",
-        flow_rates={
-            "coal": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=784),  # 296
-        },
-        flow_costs={"coal": 0, "electricity": 82},
-        flow_emissions={"coal": 0, "electricity": 0.34 / 0.4625},  # 0.34,
-        initial_status=in_stat,
-        status_inertia=nts.OnOff(0, 7),
-        status_changing_costs=nts.OnOff(49, 0),
-        costs_for_being_active=cfba,
-    )
-
-    # HKW Tiefstack:
-
-    chp2 = components.Transformer(
-        name="chp2",
-        inputs=("gas",),
-        outputs=(
-            "electricity",
-            "hot_water",
-        ),
-        conversions={
-            ("gas", "electricity"): 0.585,
-            ("gas", "hot_water"): 0.40,
-        },
-        latitude=53.53,
-        longitude=10.07,
-        region="HH",
-        node_type="HKW Tiefstack GuD",
-        component="transformer",
-        sector="coupled",
-        carrier="gas",
-        flow_rates={
-            "gas": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=123),  # 51
-            "hot_water": nts.MinMax(min=0, max=180),
-        },
-        flow_costs={
-            "gas": 0,
-            "electricity": 90,
-            "hot_water": 18.9,
-        },
-        # emissions are attributed to gas supply
-        # so pypsa can handle them better
-        flow_emissions={
-            "gas": 0,  # 0.2,
-            "electricity": 0,  # 0.2/0.585,
-            "hot_water": 0,  # 0.2/0.4,
-        },
-        initial_status=in_stat,
-        status_inertia=nts.OnOff(0, 5),
-        status_changing_costs=nts.OnOff(40, 0),
-        costs_for_being_active=cfba,
-    )
-
-    chp3 = components.Transformer(
-        name="chp3",
-        inputs=("coal",),
-        outputs=(
-            "electricity",
-            "hot_water",
-        ),
-        conversions={
-            ("coal", "electricity"): 0.4075,
-            ("coal", "hot_water"): 0.40,
-        },
-        latitude=53.53,
-        longitude=10.06,
-        region="HH",
-        node_type="HKW Tiefstack Block 2",
-        component="transformer",
-        sector="coupled",
-        carrier="coal",
-        flow_rates={
-            "coal": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=188),  # 68
-            "hot_water": nts.MinMax(min=0, max=293),
-        },
-        flow_costs={
-            "coal": 0,
-            "electricity": 82,
-            "hot_water": 19.68,
-        },
-        # emissions are attributed to coal supply
-        # so pypsa can handle them better
-        flow_emissions={
-            "coal": 0,  # 0.34,
-            "electricity": 0,  # 0.34/0.4075,
-            "hot_water": 0,  # 0.34/0.4,
-        },
-        initial_status=in_stat,
-        status_inertia=nts.OnOff(0, 7),
-        status_changing_costs=nts.OnOff(49, 0),
-        costs_for_being_active=cfba,
-    )
-
-    # Wedel GT:
-
-    pp3 = components.Transformer(
-        name="pp3",
-        inputs=("oil",),
-        outputs=("electricity",),
-        conversions={("oil", "electricity"): 0.3072},
-        latitude=53.5662,
-        longitude=9.72864,
-        region="SH",
-        node_type="Wedel GT A",
-        component="transformer",
-        sector="power",
-        carrier="oil",
-        flow_rates={
-            "oil": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=50.5),  # 20.2
-        },
-        flow_costs={"oil": 0, "electricity": 90},
-        flow_emissions={
-            "oil": 0,  # 0.28,
-            "electricity": 0.28 / 0.3072,
-        },
-        initial_status=in_stat,
-        status_inertia=nts.OnOff(0, 9),
-        status_changing_costs=nts.OnOff(45, 0),
-        costs_for_being_active=cfba,
-    )
-
-    pp4 = components.Transformer(
-        name="pp4",
-        inputs=("oil",),
-        outputs=("electricity",),
-        conversions={("oil", "electricity"): 0.3072},
-        latitude=53.5662,
-        longitude=9.72864,
-        region="SH",
-        node_type="Wedel GT B",
-        component="transformer",
-        sector="power",
-        carrier="oil",
-        flow_rates={
-            "oil": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=50.5),  # 20.2
-        },
-        flow_costs={"oil": 0, "electricity": 90},
-        flow_emissions={
-            "oil": 0,  # 0.28,
-            "electricity": 0.28 / 0.3072,
-        },
-        initial_status=in_stat,
-        status_inertia=nts.OnOff(0, 9),
-        status_changing_costs=nts.OnOff(45, 0),
-        costs_for_being_active=cfba,
-    )
-
-    # HKW Wedel:
-
-    chp4 = components.Transformer(
-        name="chp4",
-        inputs=("coal",),
-        outputs=(
-            "electricity",
-            "hot_water",
-        ),
-        conversions={
-            ("coal", "electricity"): 0.4075,
-            ("coal", "hot_water"): 0.40,
-        },
-        latitude=53.5667,
-        longitude=9.72864,
-        region="SH",
-        node_type="HKW Wedel Block 1",
-        component="transformer",
-        sector="coupled",
-        carrier="coal",
-        flow_rates={
-            "coal": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=130),  # 57
-            "hot_water": nts.MinMax(min=0, max=130),
-        },
-        flow_costs={
-            "coal": 0,
-            "electricity": 82,
-            "hot_water": 19.68,
-        },
-        # emissions are attributed to coal supply
-        # so pypsa can handle them better
-        flow_emissions={
-            "coal": 0,  # 0.34,
-            "electricity": 0,  # 0.34/0.4075,
-            "hot_water": 0,  # 0.34/0.40,
-        },
-        initial_status=in_stat,
-        status_inertia=nts.OnOff(0, 7),
-        status_changing_costs=nts.OnOff(49, 0),
-        costs_for_being_active=cfba,
-    )
-
-    chp5 = components.Transformer(
-        name="chp5",
-        inputs=("coal",),
-        outputs=("electricity", "hot_water"),
-        conversions={
-            ("coal", "electricity"): 0.4075,
-            ("coal", "hot_water"): 0.40,
-        },
-        latitude=53.5667,
-        longitude=9.72864,
-        region="SH",
-        node_type="HKW Wedel Block 2",
-        component="transformer",
-        sector="coupled",
-        carrier="coal",
-        flow_rates={
-            "coal": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=118),  # 44
-            "hot_water": nts.MinMax(min=0, max=88),
-        },
-        flow_costs={
-            "coal": 0,
-            "electricity": 82,
-            "hot_water": 19.68,
-        },
-        # emissions are attributed to coal supply
-        # so pypsa can handle them better
-        flow_emissions={
-            "coal": 0,  # 0.34,
-            "electricity": 0,  # 0.34/0.4075,
-            "hot_water": 0,  # 0.34/0.40,
-        },
-        initial_status=in_stat,
-        status_inertia=nts.OnOff(0, 7),
-        status_changing_costs=nts.OnOff(49, 0),
-        costs_for_being_active=cfba,
-    )
-
-    # MVR Waste Combustion Rugenberger Damm:
-
-    chp6 = components.Transformer(
-        name="chp6",
-        inputs=("waste",),
-        outputs=(
-            "electricity",
-            "hot_water",
-        ),
-        conversions={
-            ("waste", "electricity"): 0.06,
-            ("waste", "hot_water"): 0.15,
-        },
-        latitude=53.52111,
-        longitude=9.93339,
-        region="HH",
-        node_type="MVR Müllverwertung Rugenberger Damm",
-        component="transformer",
-        sector="coupled",
-        carrier="waste",
-        flow_rates={
-            "waste": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=24),  # 9.6
-            "hot_water": nts.MinMax(min=0, max=70),
-        },
-        flow_costs={
-            "waste": 0,
-            "electricity": 82,
-            "hot_water": 20,
-        },
-        # emissions are attributed to waste supply
-        # so pypsa can handle them better
-        flow_emissions={
-            "waste": 0,  # 0.0426,
-            "electricity": 0,  # 0.0426/0.06,
-            "hot_water": 0,  # 0.0426/0.15,
-        },
-        initial_status=in_stat,
-        status_inertia=nts.OnOff(0, 9),
-        status_changing_costs=nts.OnOff(40, 0),
-        costs_for_being_active=cfba,
-    )
+    # Power Plants:
+    power_plants = _create_power_plants(in_stat, cfba)
 
     # Heizwerk Hafencity:
     hp1 = components.Transformer(
@@ -501,7 +408,7 @@ def create_hamburg_inspired_hnp_msc(periods=24):
         sector="heat",
         carrier="gas",
         flow_rates={
-            "gas": nts.MinMax(min=0, max=float("+inf")),
+            "gas": _shared.UNBOUNDED,
             "hot_water": nts.MinMax(min=0, max=348),  # max=348
         },
         flow_costs={
@@ -518,7 +425,7 @@ def create_hamburg_inspired_hnp_msc(periods=24):
             "hot_water": 0,
         },
         expansion_limits={
-            "gas": nts.MinMax(min=0, max=float("+inf")),
+            "gas": _shared.UNBOUNDED,
             "hot_water": nts.MinMax(min=348, max=float("+inf")),
         },
     )
@@ -543,7 +450,7 @@ def create_hamburg_inspired_hnp_msc(periods=24):
             ("biomass", "hot_water"): 1,
         },
         flow_rates={
-            "biomass": nts.MinMax(min=0, max=float("+inf")),
+            "biomass": _shared.UNBOUNDED,
             "electricity": nts.MinMax(min=0, max=48.4),
             "hot_water": nts.MinMax(min=0, max=126),
         },
@@ -578,10 +485,8 @@ def create_hamburg_inspired_hnp_msc(periods=24):
         flow_emissions={"electricity": 0},
         timeseries={"electricity": nts.MinMax(min=pv_hh, max=pv_hh)},
         expandable={"electricity": True},
-        expansion_costs={"electricity": utils.annuity(
-            capex=1000000, n=20, wacc=0.05)},
-        expansion_limits={"electricity": nts.MinMax(
-            min=max_pv, max=float("+inf"))},
+        expansion_costs={"electricity": _PV_ANNUITY},
+        expansion_limits={"electricity": nts.MinMax(min=max_pv, max=float("+inf"))},
     )
 
     won1 = components.Source(
@@ -597,10 +502,8 @@ def create_hamburg_inspired_hnp_msc(periods=24):
         flow_emissions={"electricity": 0.007},  # 0.007
         timeseries={"electricity": nts.MinMax(min=wo_hh, max=wo_hh)},
         expandable={"electricity": True},
-        expansion_costs={"electricity": utils.annuity(
-            capex=1750000, n=20, wacc=0.05)},
-        expansion_limits={"electricity": nts.MinMax(
-            min=max_wo, max=float("+inf"))},
+        expansion_costs={"electricity": _WIND_ANNUITY},
+        expansion_limits={"electricity": nts.MinMax(min=max_wo, max=float("+inf"))},
     )
 
     bm_supply = components.Source(
@@ -627,12 +530,11 @@ def create_hamburg_inspired_hnp_msc(periods=24):
         sector="power",
         carrier="electricity",
         component="storage",
-        flow_rates={"electricity": nts.MinMax(0, float("+inf"))},
+        flow_rates={"electricity": _shared.UNBOUNDED},
         flow_costs={"electricity": 20},
         flow_emissions={"electricity": 0},
         expendable={"capacity": True, "electricity": False},
-        expansion_costs={"capacity": utils.annuity(
-            capex=1000000, n=10, wacc=0.05)},
+        expansion_costs={"capacity": _STORAGE_ANNUITY},
     )
 
     # P2H Karoline:
@@ -652,14 +554,13 @@ def create_hamburg_inspired_hnp_msc(periods=24):
         sector="heat",
         carrier="hot_water",
         flow_rates={
-            "electricity": nts.MinMax(min=0, max=float("+inf")),
+            "electricity": _shared.UNBOUNDED,
             "hot_water": nts.MinMax(min=0, max=45),
         },  # 45
         flow_costs={"electricity": 0, "hot_water": 0},
         flow_emissions={"electricity": 0, "hot_water": 0},  # 0.007
         expandable={"electricity": False, "hot_water": True},
-        expansion_costs={"hot_water": utils.annuity(
-            capex=200000, n=30, wacc=0.05)},
+        expansion_costs={"hot_water": _P2H_ANNUITY},
         expansion_limits={"hot_water": nts.MinMax(min=45, max=200)},
     )
 
@@ -894,16 +795,16 @@ def create_hamburg_inspired_hnp_msc(periods=24):
             imth,
         ),
         transformers=(
-            chp1,
-            chp2,
-            chp3,
-            chp4,
-            chp5,
-            chp6,
-            pp1,
-            pp2,
-            pp3,
-            pp4,
+            power_plants["chp1"],
+            power_plants["chp2"],
+            power_plants["chp3"],
+            power_plants["chp4"],
+            power_plants["chp5"],
+            power_plants["chp6"],
+            power_plants["pp1"],
+            power_plants["pp2"],
+            power_plants["pp3"],
+            power_plants["pp4"],
             hp1,
             p2h,
             bm_chp,
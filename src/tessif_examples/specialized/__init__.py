@@ -1,7 +1,21 @@
 # src/tessif_examples/specialized/__init__.py
 # flake8: noqa
 """Collection of specialized tessif system models."""
+from typing import TYPE_CHECKING
 
-from .generic_grid import create_generic_grid
-from .self_similar_system_model import create_self_similar_system_model
-from .variable_chp import create_variable_chp
+from tessif_examples._lazy import attach
+
+if TYPE_CHECKING:
+    from .generic_grid import create_generic_grid
+    from .self_similar_system_model import create_self_similar_system_model
+    from .variable_chp import create_variable_chp
+
+_FACTORY_MODULES = {
+    "create_generic_grid": "generic_grid",
+    "create_self_similar_system_model": "self_similar_system_model",
+    "create_variable_chp": "variable_chp",
+}
+
+__all__ = list(_FACTORY_MODULES)
+
+__getattr__, __dir__ = attach(__name__, _FACTORY_MODULES)
@@ -3,11 +3,67 @@
 # pylint: disable=duplicate-code
 # pylint: disable=too-many-lines
 """Generic grid tessif energy system model example."""
+import types
+
 import numpy as np
 import tessif.frused.namedtuples as nts
 from pandas import date_range
 from tessif import components, system_model
 
+_INF = float("+inf")
+"""Positive infinity, the generic grid's value for unlimited parameters."""
+
+_COMMON = types.MappingProxyType({"latitude": 42, "longitude": 42, "region": "Here"})
+"""Location parameters shared by all generic grid components."""
+
+_UNBOUNDED = nts.MinMax(min=0, max=_INF)
+"""Limits of the generic grid components' unconstrained amounts and flows."""
+
+_FREE_GRADIENTS = nts.PositiveNegative(positive=_INF, negative=_INF)
+"""Limits of the generic grid storages' unconstrained flow gradients."""
+
+_NO_GRADIENT_COSTS = nts.PositiveNegative(positive=0, negative=0)
+"""Gradient costs of the generic grid components' free flow gradients."""
+
+_NO_STATUS_CHANGING_COSTS = nts.OnOff(on=0, off=0)
+"""Status changing costs of the generic grid components' free status changes."""
+
+
+_PROFILE_VALUES = types.MappingProxyType(
+    {
+        "Solar Panel": (12, 22, 7),
+        "Commercial Demand": (80, 20, 130),
+        "District Heating Demand": (340, 300, 380),
+        "Onshore Wind Power": (60, 80, 34),
+        "Solar Thermal": (24, 44, 14),
+        "Industrial Demand": (160, 160, 120),
+        "Car charging Station": (0, 0, 100),
+        "Offshore Wind Power": (120, 140, 70),
+    }
+)
+"""Fixed flow values of the generic grid components, keyed by name."""
+
+
+def _fixed_profile(name):
+    """Create the timeseries fixing a generic grid component's flow.
+
+    Each call creates a new float array, so the timeseries of separately
+    created system models can be modified independently.
+
+    Parameters
+    ----------
+    name : str
+        Name of the component, as used in :attr:`_PROFILE_VALUES`.
+
+    Returns
+    -------
+    tessif.frused.namedtuples.MinMax
+        Timeseries whose minimum and maximum share the same
+        :class:`numpy.ndarray` of the component's fixed flow values.
+    """
+    profile = np.array(_PROFILE_VALUES[name], dtype=np.float64)
+    return nts.MinMax(min=profile, max=profile)
+
 
 def create_generic_grid():
     """Create a generic grid-focused tessif system model scenario combination.
@@ -27,21 +83,19 @@ def create_generic_grid():
         :align: center
         :alt: Image showing the generic grid energy system graph.
     """
-    timeframe = date_range("7/13/1990", periods=3, freq="H")
+    timeframe = date_range("1990-07-13", periods=3, freq="h")
 
     global_constraints = {
         "name": "default",
-        "emissions": float("+inf"),
-        "resources": float("+inf"),
+        "emissions": _INF,
+        "resources": _INF,
     }
 
     solar_panel = components.Source(
         name="Solar Panel",
         outputs=("electricity",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="Electricity",
         node_type="Renewable",
@@ -50,20 +104,16 @@ def create_generic_grid():
         flow_costs={"electricity": 0},
         flow_emissions={"electricity": 0},
         flow_gradients={"electricity": nts.PositiveNegative(positive=42, negative=42)},
-        gradient_costs={"electricity": nts.PositiveNegative(positive=0, negative=0)},
-        timeseries={
-            "electricity": nts.MinMax(
-                min=np.array([12, 22, 7]), max=np.array([12, 22, 7])
-            )
-        },
+        gradient_costs={"electricity": _NO_GRADIENT_COSTS},
+        timeseries={"electricity": _fixed_profile("Solar Panel")},
         expandable={"electricity": False},
         expansion_costs={"electricity": 5},
-        expansion_limits={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"electricity": _UNBOUNDED},
         milp={"electricity": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=1, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=10),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=10),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -72,28 +122,26 @@ def create_generic_grid():
         name="Gas Station",
         outputs=("fuel",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="Gas",
         node_type="source",
-        accumulated_amounts={"fuel": nts.MinMax(min=0, max=float("+inf"))},
+        accumulated_amounts={"fuel": _UNBOUNDED},
         # max=100)},   float('+inf'))},
         flow_rates={"fuel": nts.MinMax(min=0, max=1000)},
         flow_costs={"fuel": 10},
         flow_emissions={"fuel": 3},
         flow_gradients={"fuel": nts.PositiveNegative(positive=1000, negative=1000)},
-        gradient_costs={"fuel": nts.PositiveNegative(positive=0, negative=0)},
+        gradient_costs={"fuel": _NO_GRADIENT_COSTS},
         timeseries=None,
         expandable={"fuel": False},
         expansion_costs={"fuel": 5},
-        expansion_limits={"fuel": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"fuel": _UNBOUNDED},
         milp={"fuel": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=1, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=10),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=10),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -102,28 +150,26 @@ def create_generic_grid():
         name="Biogas plant",
         outputs=("fuel",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Coupled",
         carrier="Gas",
         node_type="source",
-        accumulated_amounts={"fuel": nts.MinMax(min=0, max=float("+inf"))},
+        accumulated_amounts={"fuel": _UNBOUNDED},
         # max=100)},   float('+inf'))},
         flow_rates={"fuel": nts.MinMax(min=0, max=1000)},
         flow_costs={"fuel": 0},  # flow_costs={'fuel': 8},
         flow_emissions={"fuel": 0},  # flow_emissions={'fuel': 3},
         flow_gradients={"fuel": nts.PositiveNegative(positive=1000, negative=1000)},
-        gradient_costs={"fuel": nts.PositiveNegative(positive=0, negative=0)},
+        gradient_costs={"fuel": _NO_GRADIENT_COSTS},
         timeseries=None,
         expandable={"fuel": False},
         expansion_costs={"fuel": 5},
-        expansion_limits={"fuel": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"fuel": _UNBOUNDED},
         milp={"fuel": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=1, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=10),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=10),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -134,9 +180,7 @@ def create_generic_grid():
         outputs=("electricity", "heat"),
         conversions={("fuel", "electricity"): 0.35, ("fuel", "heat"): 0.55},
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Coupled",
         carrier="electricity",
         node_type="transformer",
@@ -153,23 +197,23 @@ def create_generic_grid():
             "heat": nts.PositiveNegative(positive=100, negative=100),
         },
         gradient_costs={
-            "fuel": nts.PositiveNegative(positive=0, negative=0),
-            "electricity": nts.PositiveNegative(positive=0, negative=0),
-            "heat": nts.PositiveNegative(positive=0, negative=0),
+            "fuel": _NO_GRADIENT_COSTS,
+            "electricity": _NO_GRADIENT_COSTS,
+            "heat": _NO_GRADIENT_COSTS,
         },
         timeseries=None,
         expandable={"fuel": False, "electricity": False, "heat": False},
         expansion_costs={"fuel": 0, "electricity": 0, "heat": 0},
         expansion_limits={
-            "fuel": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=float("+inf")),
-            "heat": nts.MinMax(min=0, max=float("+inf")),
+            "fuel": _UNBOUNDED,
+            "electricity": _UNBOUNDED,
+            "heat": _UNBOUNDED,
         },
         milp={"electricity": False, "fuel": False, "heat": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=0, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=9),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=9),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -178,29 +222,27 @@ def create_generic_grid():
         name="Household Demand",
         inputs=("electricity",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="electricity",
         node_type="demand",
-        accumulated_amounts={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        accumulated_amounts={"electricity": _UNBOUNDED},
         flow_rates={"electricity": nts.MinMax(min=190, max=190)},
         flow_costs={"electricity": 0},
         flow_emissions={"electricity": 0},
         flow_gradients={
             "electricity": nts.PositiveNegative(positive=200, negative=200)
         },
-        gradient_costs={"electricity": nts.PositiveNegative(positive=0, negative=0)},
+        gradient_costs={"electricity": _NO_GRADIENT_COSTS},
         timeseries=None,
         expandable={"electricity": False},
         expansion_costs={"electricity": 0},
-        expansion_limits={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"electricity": _UNBOUNDED},
         milp={"electricity": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=2, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=8),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=8),
         costs_for_being_active=0
         # Total number of arguments to specify sink object
     )
@@ -209,33 +251,27 @@ def create_generic_grid():
         name="Commercial Demand",
         inputs=("electricity",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="electricity",
         node_type="demand",
-        accumulated_amounts={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        accumulated_amounts={"electricity": _UNBOUNDED},
         flow_rates={"electricity": nts.MinMax(min=0, max=200)},
         flow_costs={"electricity": 0},
         flow_emissions={"electricity": 0},
         flow_gradients={
             "electricity": nts.PositiveNegative(positive=200, negative=200)
         },
-        gradient_costs={"electricity": nts.PositiveNegative(positive=0, negative=0)},
-        timeseries={
-            "electricity": nts.MinMax(
-                min=np.array([80, 20, 130]), max=np.array([80, 20, 130])
-            )
-        },
+        gradient_costs={"electricity": _NO_GRADIENT_COSTS},
+        timeseries={"electricity": _fixed_profile("Commercial Demand")},
         expandable={"electricity": False},
         expansion_costs={"electricity": 0},
-        expansion_limits={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"electricity": _UNBOUNDED},
         milp={"electricity": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=2, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=8),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=8),
         costs_for_being_active=0
         # Total number of arguments to specify sink object
     )
@@ -244,31 +280,25 @@ def create_generic_grid():
         name="District Heating Demand",
         inputs=("heat",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Heat",
         carrier="hot Water",
         node_type="demand",
-        accumulated_amounts={"heat": nts.MinMax(min=0, max=float("+inf"))},
+        accumulated_amounts={"heat": _UNBOUNDED},
         flow_rates={"heat": nts.MinMax(min=300, max=500)},
         flow_costs={"heat": 0},
         flow_emissions={"heat": 0},
         flow_gradients={"heat": nts.PositiveNegative(positive=500, negative=500)},
-        gradient_costs={"heat": nts.PositiveNegative(positive=0, negative=0)},
-        timeseries={
-            "heat": nts.MinMax(
-                min=np.array([340, 300, 380]), max=np.array([340, 300, 380])
-            )
-        },
+        gradient_costs={"heat": _NO_GRADIENT_COSTS},
+        timeseries={"heat": _fixed_profile("District Heating Demand")},
         expandable={"heat": False},
         expansion_costs={"heat": 0},
-        expansion_limits={"heat": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"heat": _UNBOUNDED},
         milp={"heat": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=2, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=8),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=8),
         costs_for_being_active=0
         # Total number of arguments to specify sink object
     )
@@ -280,9 +310,7 @@ def create_generic_grid():
         capacity=20,
         initial_soc=10,
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="electricity",
         node_type="storage",
@@ -291,24 +319,20 @@ def create_generic_grid():
         flow_efficiencies={"electricity": nts.InOut(inflow=1, outflow=1)},
         flow_costs={"electricity": 0},
         flow_emissions={"electricity": 0},
-        flow_gradients={
-            "electricity": nts.PositiveNegative(
-                positive=float("+inf"), negative=float("+inf")
-            )
-        },
-        gradient_costs={"electricity": nts.PositiveNegative(positive=0, negative=0)},
+        flow_gradients={"electricity": _FREE_GRADIENTS},
+        gradient_costs={"electricity": _NO_GRADIENT_COSTS},
         timeseries=None,
         expandable={"capacity": False, "electricity": False},
         expansion_costs={"capacity": 2, "electricity": 0},
         expansion_limits={
-            "capacity": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=float("+inf")),
+            "capacity": _UNBOUNDED,
+            "electricity": _UNBOUNDED,
         },
         milp={"electricity": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=0, off=2),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=42),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=42),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -318,9 +342,7 @@ def create_generic_grid():
         inputs=("Gas Station.fuel",),
         outputs=("GuD.fuel",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="gas",
         node_type="bus",
@@ -332,9 +354,7 @@ def create_generic_grid():
         inputs=("Biogas plant.fuel",),
         outputs=("BHKW.fuel",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Coupled",
         carrier="gas",
         node_type="bus",
@@ -354,9 +374,7 @@ def create_generic_grid():
             "Battery.electricity",
         ),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="electricity",
         node_type="bus",
@@ -374,9 +392,7 @@ def create_generic_grid():
         ),
         outputs=("District Heating Demand.heat", "Heat Storage.heat"),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Heat",
         carrier="hot Water",
         node_type="bus",
@@ -389,9 +405,7 @@ def create_generic_grid():
         name="Onshore Wind Power",
         outputs=("electricity",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="Electricity",
         node_type="Renewable",
@@ -402,20 +416,16 @@ def create_generic_grid():
         flow_gradients={
             "electricity": nts.PositiveNegative(positive=100, negative=100)
         },
-        gradient_costs={"electricity": nts.PositiveNegative(positive=0, negative=0)},
-        timeseries={
-            "electricity": nts.MinMax(
-                min=np.array([60, 80, 34]), max=np.array([60, 80, 34])
-            )
-        },
+        gradient_costs={"electricity": _NO_GRADIENT_COSTS},
+        timeseries={"electricity": _fixed_profile("Onshore Wind Power")},
         expandable={"electricity": False},
         expansion_costs={"electricity": 8},
-        expansion_limits={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"electricity": _UNBOUNDED},
         milp={"electricity": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=1, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=10),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=10),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -424,9 +434,7 @@ def create_generic_grid():
         name="Solar Thermal",
         outputs=("heat",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Heat",
         carrier="Hot Water",
         node_type="Renewable",
@@ -435,18 +443,16 @@ def create_generic_grid():
         flow_costs={"heat": 0},
         flow_emissions={"heat": 0},
         flow_gradients={"heat": nts.PositiveNegative(positive=42, negative=42)},
-        gradient_costs={"heat": nts.PositiveNegative(positive=0, negative=0)},
-        timeseries={
-            "heat": nts.MinMax(min=np.array([24, 44, 14]), max=np.array([24, 44, 14]))
-        },
+        gradient_costs={"heat": _NO_GRADIENT_COSTS},
+        timeseries={"heat": _fixed_profile("Solar Thermal")},
         expandable={"heat": False},
         expansion_costs={"heat": 4},
-        expansion_limits={"heat": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"heat": _UNBOUNDED},
         milp={"heat": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=1, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=10),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=10),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -455,33 +461,27 @@ def create_generic_grid():
         name="Industrial Demand",
         inputs=("electricity",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="electricity",
         node_type="demand",
-        accumulated_amounts={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        accumulated_amounts={"electricity": _UNBOUNDED},
         flow_rates={"electricity": nts.MinMax(min=0, max=400)},
         flow_costs={"electricity": 0},
         flow_emissions={"electricity": 0},
         flow_gradients={
             "electricity": nts.PositiveNegative(positive=400, negative=400)
         },
-        gradient_costs={"electricity": nts.PositiveNegative(positive=0, negative=0)},
-        timeseries={
-            "electricity": nts.MinMax(
-                min=np.array([160, 160, 120]), max=np.array([160, 160, 120])
-            )
-        },
+        gradient_costs={"electricity": _NO_GRADIENT_COSTS},
+        timeseries={"electricity": _fixed_profile("Industrial Demand")},
         expandable={"electricity": False},
         expansion_costs={"electricity": 0},
-        expansion_limits={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"electricity": _UNBOUNDED},
         milp={"electricity": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=2, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=8),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=8),
         costs_for_being_active=0
         # Total number of arguments to specify sink object
     )
@@ -490,33 +490,27 @@ def create_generic_grid():
         name="Car charging Station",
         inputs=("electricity",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="electricity",
         node_type="demand",
-        accumulated_amounts={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        accumulated_amounts={"electricity": _UNBOUNDED},
         flow_rates={"electricity": nts.MinMax(min=0, max=1000)},
         flow_costs={"electricity": 0},
         flow_emissions={"electricity": 0},
         flow_gradients={
             "electricity": nts.PositiveNegative(positive=1000, negative=1000)
         },
-        gradient_costs={"electricity": nts.PositiveNegative(positive=0, negative=0)},
-        timeseries={
-            "electricity": nts.MinMax(
-                min=np.array([0, 0, 100]), max=np.array([0, 0, 100])
-            )
-        },
+        gradient_costs={"electricity": _NO_GRADIENT_COSTS},
+        timeseries={"electricity": _fixed_profile("Car charging Station")},
         expandable={"electricity": False},
         expansion_costs={"electricity": 0},
-        expansion_limits={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"electricity": _UNBOUNDED},
         milp={"electricity": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=2, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=8),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=8),
         costs_for_being_active=0
         # Total number of arguments to specify sink object
     )
@@ -527,9 +521,7 @@ def create_generic_grid():
         outputs=("heat",),
         conversions={("electricity", "heat"): 1.00},
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="coupled",
         carrier="Hot Water",
         node_type="transformer",
@@ -544,21 +536,21 @@ def create_generic_grid():
             "heat": nts.PositiveNegative(positive=100, negative=100),
         },
         gradient_costs={
-            "electricity": nts.PositiveNegative(positive=0, negative=0),
-            "heat": nts.PositiveNegative(positive=0, negative=0),
+            "electricity": _NO_GRADIENT_COSTS,
+            "heat": _NO_GRADIENT_COSTS,
         },
         timeseries=None,
         expandable={"electricity": False, "heat": False},
         expansion_costs={"electricity": 0, "heat": 0},
         expansion_limits={
-            "electricity": nts.MinMax(min=0, max=float("+inf")),
-            "heat": nts.MinMax(min=0, max=float("+inf")),
+            "electricity": _UNBOUNDED,
+            "heat": _UNBOUNDED,
         },
         milp={"electricity": False, "fuel": False, "heat": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=0, off=0),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=9),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=9),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -570,9 +562,7 @@ def create_generic_grid():
         capacity=50,
         initial_soc=10,
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Heat",
         carrier="Hot Water",
         node_type="storage",
@@ -581,22 +571,20 @@ def create_generic_grid():
         flow_efficiencies={"heat": nts.InOut(inflow=0.95, outflow=0.95)},
         flow_costs={"heat": 0},
         flow_emissions={"heat": 0},
-        flow_gradients={
-            "heat": nts.PositiveNegative(positive=float("+inf"), negative=float("+inf"))
-        },
-        gradient_costs={"heat": nts.PositiveNegative(positive=0, negative=0)},
+        flow_gradients={"heat": _FREE_GRADIENTS},
+        gradient_costs={"heat": _NO_GRADIENT_COSTS},
         timeseries=None,
         expandable={"capacity": False, "heat": False},
         expansion_costs={"capacity": 2, "heat": 0},
         expansion_limits={
-            "capacity": nts.MinMax(min=0, max=float("+inf")),
-            "heat": nts.MinMax(min=0, max=float("+inf")),
+            "capacity": _UNBOUNDED,
+            "heat": _UNBOUNDED,
         },
         milp={"heat": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=0, off=2),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=42),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=42),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -610,24 +598,22 @@ def create_generic_grid():
             "Power to Heat.electricity",
         ),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="electricity",
         node_type="bus",
         # Total number of arguments to specify bus object
     )
 
+    medium_uid = str(medium_electricity_line.uid)
+    low_uid = str(low_electricity_line.uid)
+
     low_medium_transformator = components.Connector(
         name="Low Voltage Transformator",
-        interfaces=(str(medium_electricity_line.uid), str(low_electricity_line.uid)),
+        interfaces=(medium_uid, low_uid),
         conversions={
-            (str(medium_electricity_line.uid), str(low_electricity_line.uid)): 1,
-            (
-                str(low_electricity_line.uid),
-                str(medium_electricity_line.uid),
-            ): 1,
+            (medium_uid, low_uid): 1,
+            (low_uid, medium_uid): 1,
         },
         timeseries=None,
         node_type="connector",
@@ -640,9 +626,7 @@ def create_generic_grid():
         name="Offshore Wind Power",
         outputs=("electricity",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="Electricity",
         node_type="Renewable",
@@ -653,20 +637,16 @@ def create_generic_grid():
         flow_gradients={
             "electricity": nts.PositiveNegative(positive=200, negative=200)
         },
-        gradient_costs={"electricity": nts.PositiveNegative(positive=0, negative=0)},
-        timeseries={
-            "electricity": nts.MinMax(
-                min=np.array([120, 140, 70]), max=np.array([120, 140, 70])
-            )
-        },
+        gradient_costs={"electricity": _NO_GRADIENT_COSTS},
+        timeseries={"electricity": _fixed_profile("Offshore Wind Power")},
         expandable={"electricity": False},
         expansion_costs={"electricity": 9},
-        expansion_limits={"electricity": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"electricity": _UNBOUNDED},
         milp={"electricity": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=1, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=10),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=10),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -675,28 +655,26 @@ def create_generic_grid():
         name="Coal Supply",
         outputs=("fuel",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Coupled",
         carrier="Coal",
         node_type="source",
-        accumulated_amounts={"fuel": nts.MinMax(min=0, max=float("+inf"))},
+        accumulated_amounts={"fuel": _UNBOUNDED},
         # max=100)},   float('+inf'))},
         flow_rates={"fuel": nts.MinMax(min=0, max=500)},
         flow_costs={"fuel": 8},
         flow_emissions={"fuel": 5},
         flow_gradients={"fuel": nts.PositiveNegative(positive=500, negative=500)},
-        gradient_costs={"fuel": nts.PositiveNegative(positive=0, negative=0)},
+        gradient_costs={"fuel": _NO_GRADIENT_COSTS},
         timeseries=None,
         expandable={"fuel": False},
         expansion_costs={"fuel": 5},
-        expansion_limits={"fuel": nts.MinMax(min=0, max=float("+inf"))},
+        expansion_limits={"fuel": _UNBOUNDED},
         milp={"fuel": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=1, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=10),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=10),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -707,9 +685,7 @@ def create_generic_grid():
         outputs=("electricity", "heat"),
         conversions={("fuel", "electricity"): 0.35, ("fuel", "heat"): 0.53},
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Coupled",
         carrier="electricity",
         node_type="transformer",
@@ -726,23 +702,23 @@ def create_generic_grid():
             "heat": nts.PositiveNegative(positive=500, negative=500),
         },
         gradient_costs={
-            "fuel": nts.PositiveNegative(positive=0, negative=0),
-            "electricity": nts.PositiveNegative(positive=0, negative=0),
-            "heat": nts.PositiveNegative(positive=0, negative=0),
+            "fuel": _NO_GRADIENT_COSTS,
+            "electricity": _NO_GRADIENT_COSTS,
+            "heat": _NO_GRADIENT_COSTS,
         },
         timeseries=None,
         expandable={"fuel": False, "electricity": False, "heat": False},
         expansion_costs={"fuel": 0, "electricity": 0, "heat": 0},
         expansion_limits={
-            "fuel": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=float("+inf")),
-            "heat": nts.MinMax(min=0, max=float("+inf")),
+            "fuel": _UNBOUNDED,
+            "electricity": _UNBOUNDED,
+            "heat": _UNBOUNDED,
         },
         milp={"electricity": False, "fuel": False, "heat": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=0, off=1),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=9),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=9),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -753,9 +729,7 @@ def create_generic_grid():
         outputs=("electricity",),
         conversions={("fuel", "electricity"): 0.6},
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="electricity",
         node_type="transformer",
@@ -770,21 +744,21 @@ def create_generic_grid():
             "electricity": nts.PositiveNegative(positive=500, negative=500),
         },
         gradient_costs={
-            "fuel": nts.PositiveNegative(positive=0, negative=0),
-            "electricity": nts.PositiveNegative(positive=0, negative=0),
+            "fuel": _NO_GRADIENT_COSTS,
+            "electricity": _NO_GRADIENT_COSTS,
         },
         timeseries=None,
         expandable={"fuel": False, "electricity": False},
         expansion_costs={"fuel": 0, "electricity": 0},
         expansion_limits={
-            "fuel": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=float("+inf")),
+            "fuel": _UNBOUNDED,
+            "electricity": _UNBOUNDED,
         },
         milp={"electricity": False, "fuel": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=0, off=2),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=9),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=9),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -796,9 +770,7 @@ def create_generic_grid():
         capacity=400,
         initial_soc=50,
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="electricity",
         node_type="storage",
@@ -807,24 +779,20 @@ def create_generic_grid():
         flow_efficiencies={"electricity": nts.InOut(inflow=0.9, outflow=0.9)},
         flow_costs={"electricity": 0},
         flow_emissions={"electricity": 0},
-        flow_gradients={
-            "electricity": nts.PositiveNegative(
-                positive=float("+inf"), negative=float("+inf")
-            )
-        },
-        gradient_costs={"electricity": nts.PositiveNegative(positive=0, negative=0)},
+        flow_gradients={"electricity": _FREE_GRADIENTS},
+        gradient_costs={"electricity": _NO_GRADIENT_COSTS},
         timeseries=None,
         expandable={"capacity": False, "electricity": False},
         expansion_costs={"capacity": 2, "electricity": 0},
         expansion_limits={
-            "capacity": nts.MinMax(min=0, max=float("+inf")),
-            "electricity": nts.MinMax(min=0, max=float("+inf")),
+            "capacity": _UNBOUNDED,
+            "electricity": _UNBOUNDED,
         },
         milp={"electricity": False},
         initial_status=True,
         status_inertia=nts.OnOff(on=0, off=2),
-        status_changing_costs=nts.OnOff(on=0, off=0),
-        number_of_status_changes=nts.OnOff(on=float("+inf"), off=42),
+        status_changing_costs=_NO_STATUS_CHANGING_COSTS,
+        number_of_status_changes=nts.OnOff(on=_INF, off=42),
         costs_for_being_active=0
         # Total number of arguments to specify source object
     )
@@ -834,9 +802,7 @@ def create_generic_grid():
         inputs=("Coal Supply.fuel",),
         outputs=("HKW.fuel",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Coupled",
         carrier="Coal",
         node_type="bus",
@@ -853,24 +819,21 @@ def create_generic_grid():
         ),
         outputs=("Pumped Storage.electricity",),
         # Minimum number of arguments required
-        latitude=42,
-        longitude=42,
-        region="Here",
+        **_COMMON,
         sector="Power",
         carrier="electricity",
         node_type="bus",
         # Total number of arguments to specify bus object
     )
 
+    high_uid = str(high_electricity_line.uid)
+
     high_medium_transformator = components.Connector(
         name="High Voltage Transformator",
-        interfaces=(str(medium_electricity_line.uid), str(high_electricity_line.uid)),
+        interfaces=(medium_uid, high_uid),
         conversions={
-            (str(medium_electricity_line.uid), str(high_electricity_line.uid)): 1,
-            (
-                str(high_electricity_line.uid),
-                str(medium_electricity_line.uid),
-            ): 1,
+            (medium_uid, high_uid): 1,
+            (high_uid, medium_uid): 1,
         },
         timeseries=None,
         node_type="connector",
@@ -879,36 +842,43 @@ def create_generic_grid():
 
     # Building the Energysystem
 
+    busses = (
+        gas_supply_line,
+        low_electricity_line,
+        heat_line,
+        medium_electricity_line,
+        high_electricity_line,
+        coal_supply_line,
+        biogas_supply_line,
+    )
+    sinks = (
+        household_demand,
+        commercial_demand,
+        heat_demand,
+        industrial_demand,
+        car_charging_station_demand,
+    )
+    sources = (
+        solar_panel,
+        gas_supply,
+        onshore_wind_power,
+        offshore_wind_power,
+        coal_supply,
+        solar_thermal,
+        biogas_supply,
+    )
+    transformers = (bhkw_generator, power_to_heat, gud_generator, hkw_generator)
+    storages = (battery_storage, heat_storage, pumped_storage)
+    connectors = (low_medium_transformator, high_medium_transformator)
+
     esys = system_model.AbstractEnergySystem(
         uid="Generic_Grid",
-        busses=(
-            gas_supply_line,
-            low_electricity_line,
-            heat_line,
-            medium_electricity_line,
-            high_electricity_line,
-            coal_supply_line,
-            biogas_supply_line,
-        ),
-        sinks=(
-            household_demand,
-            commercial_demand,
-            heat_demand,
-            industrial_demand,
-            car_charging_station_demand,
-        ),
-        sources=(
-            solar_panel,
-            gas_supply,
-            onshore_wind_power,
-            offshore_wind_power,
-            coal_supply,
-            solar_thermal,
-            biogas_supply,
-        ),
-        transformers=(bhkw_generator, power_to_heat, gud_generator, hkw_generator),
-        storages=(battery_storage, heat_storage, pumped_storage),
-        connectors=(low_medium_transformator, high_medium_transformator),
+        busses=busses,
+        sinks=sinks,
+        sources=sources,
+        transformers=transformers,
+        storages=storages,
+        connectors=connectors,
         timeframe=timeframe,
         global_constraints=global_constraints,
     )
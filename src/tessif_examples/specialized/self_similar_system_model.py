@@ -1,6 +1,7 @@
 # src/tessif_examples/self_similar_system_model.py
 """Tessif minimum working example energy system model."""
 import datetime
+import itertools
 import random
 
 import tessif.frused.namedtuples as nts
@@ -36,7 +37,7 @@ def create_self_similar_system_model(n=1, timeframe=None, unit="minimal", **kwar
 
             idx = pd.DatetimeIndex(
                 data=pd.date_range(
-                    '2016-01-01 00:00:00', periods=11, freq='H'))
+                    '2016-01-01 00:00:00', periods=11, freq='h'))
 
     unit: str
         Specify which of tessif's hardcoded examples should be used as unit of
@@ -60,7 +61,7 @@ def create_self_similar_system_model(n=1, timeframe=None, unit="minimal", **kwar
         Are passed to the _create_[...]_unit() function.
     """
     if timeframe is None:
-        timeframe = date_range(datetime.datetime.now().date(), periods=5, freq="H")
+        timeframe = date_range(datetime.datetime.now().date(), periods=5, freq="h")
 
     # Create the energy system using tessif
     fractals = list()
@@ -83,16 +84,24 @@ def create_self_similar_system_model(n=1, timeframe=None, unit="minimal", **kwar
 
     self_similar_es = system_model.AbstractEnergySystem(
         uid=f"Self Similar System Model (n={n})",
-        busses=[bus for fractal in fractals for bus in fractal.busses],
-        sinks=[sink for fractal in fractals for sink in fractal.sinks],
-        sources=[source for fractal in fractals for source in fractal.sources],
-        connectors=[
-            connector for fractal in fractals for connector in fractal.connectors
-        ],
-        transformers=[
-            transformer for fractal in fractals for transformer in fractal.transformers
-        ],
-        storages=[storage for fractal in fractals for storage in fractal.storages],
+        busses=tuple(
+            itertools.chain.from_iterable(fractal.busses for fractal in fractals)
+        ),
+        sinks=tuple(
+            itertools.chain.from_iterable(fractal.sinks for fractal in fractals)
+        ),
+        sources=tuple(
+            itertools.chain.from_iterable(fractal.sources for fractal in fractals)
+        ),
+        connectors=tuple(
+            itertools.chain.from_iterable(fractal.connectors for fractal in fractals)
+        ),
+        transformers=tuple(
+            itertools.chain.from_iterable(fractal.transformers for fractal in fractals)
+        ),
+        storages=tuple(
+            itertools.chain.from_iterable(fractal.storages for fractal in fractals)
+        ),
         timeframe=timeframe,
     )
 
@@ -165,27 +174,27 @@ def create_minimal_es_unit(n, timeframe=None, seed=None):
 
             idx = pd.DatetimeIndex(
                 data=pd.date_range(
-                    '2016-01-01 00:00:00', periods=11, freq='H'))
+                    '2016-01-01 00:00:00', periods=11, freq='h'))
     """
     if timeframe is None:
         timeframe = date_range(
             datetime.datetime.now(),
             periods=5,
-            freq="H",
+            freq="h",
         )
 
     # See tessif.examples.data.tsf.py_hard as well as
     # tessif.components for examples and information
     # (both in the code and using the doc)
 
-    # 1) randomize demand and production
-    if seed:
-        random.seed(seed)
-    demand = random.randint(1, 100)
-    renewable_output = random.randint(1, 50)
+    # 1) randomize demand and production (seeded draws use their own generator
+    # to leave the global random state untouched)
+    rng = random.Random(seed) if seed else random
+    demand = rng.randint(1, 100)
+    renewable_output = rng.randint(1, 50)
 
     demand_sink = components.Sink(
-        name="Sink " + str(n),
+        name=f"Sink {n}",
         inputs=("electricity",),
         flow_rates={"electricity": nts.MinMax(min=demand, max=demand)},
     )
@@ -193,21 +202,21 @@ def create_minimal_es_unit(n, timeframe=None, seed=None):
     # excess_sink enables the energy system to be always solvable even if
     # the randomized components wouldn't provide a solvable energy system.
     excess_sink = components.Sink(
-        name="Excess Sink " + str(n),
+        name=f"Excess Sink {n}",
         inputs=("electricity",),
         flow_costs={"electricity": 100},
     )
 
     # 2) Create the sources
     excess_source = components.Source(
-        name="Excess Source " + str(n),
+        name=f"Excess Source {n}",
         outputs=("electricity",),
         flow_costs={"electricity": 100},
     )
 
     # 2.1) renewable source
     renewable_source = components.Source(
-        name="Renewable Source " + str(n),
+        name=f"Renewable Source {n}",
         outputs=("electricity",),
         flow_costs={"electricity": 5},
         node_type="Renewable",
@@ -220,46 +229,35 @@ def create_minimal_es_unit(n, timeframe=None, seed=None):
 
     # 2.2) non-renewable source
     non_renewable_source = components.Source(
-        name="Non Renewable Source " + str(n),
+        name=f"Non Renewable Source {n}",
         outputs=("fuel",),
         flow_costs={"fuel": 10},
     )
 
     # 3) Create the transformer
     power_generator = components.Transformer(
-        name="Power Generator " + str(n),
+        name=f"Power Generator {n}",
         inputs=("fuel",),
         outputs=("electricity",),
         conversions={("fuel", "electricity"): 0.42},
     )
 
-    # 4) Create the connector. (Use connectors list to prevent error in case no
-    # connector is created.)
-    connectors = list()
-
+    # 4) Create the connector to the previous unit. (The first unit has none.)
     if n == 0:
-        pass
+        connectors = ()
     else:
+        central_busses = (f"Central Bus {n - 1}", f"Central Bus {n}")
         connector = components.Connector(
-            name="Connector " + str(n),
-            interfaces=(
-                "Central Bus " + str(n - 1),
-                "Central Bus " + str(n),
-            ),
-            inputs=[
-                "Central Bus " + str(n - 1),
-                "Central Bus " + str(n),
-            ],
-            outputs=(
-                "Central Bus " + str(n - 1),
-                "Central Bus " + str(n),
-            ),
+            name=f"Connector {n}",
+            interfaces=central_busses,
+            inputs=list(central_busses),
+            outputs=central_busses,
         )
-        connectors.append(connector)
+        connectors = (connector,)
 
     # 5) Create the storage
     storage = components.Storage(
-        name="Storage " + str(n),
+        name=f"Storage {n}",
         input="electricity",
         output="electricity",
         capacity=1,
@@ -268,30 +266,30 @@ def create_minimal_es_unit(n, timeframe=None, seed=None):
 
     # 6) Create the bus
     central_bus = components.Bus(
-        name="Central Bus " + str(n),
+        name=f"Central Bus {n}",
         inputs=(
-            "Excess Source " + str(n) + ".electricity",
-            "Storage " + str(n) + ".electricity",
-            "Renewable Source " + str(n) + ".electricity",
-            "Power Generator " + str(n) + ".electricity",
+            f"Excess Source {n}.electricity",
+            f"Storage {n}.electricity",
+            f"Renewable Source {n}.electricity",
+            f"Power Generator {n}.electricity",
         ),
         outputs=(
-            "Excess Sink " + str(n) + ".electricity",
-            "Sink " + str(n) + ".electricity",
-            "Storage " + str(n) + ".electricity",
+            f"Excess Sink {n}.electricity",
+            f"Sink {n}.electricity",
+            f"Storage {n}.electricity",
         ),
     )
 
     # There needs to be another bus which connects the transformer and the
     # non-renewable source.
     fuel_line = components.Bus(
-        name="Fuel Line " + str(n),
-        inputs=("Non Renewable Source " + str(n) + ".fuel",),
-        outputs=("Power Generator " + str(n) + ".fuel",),
+        name=f"Fuel Line {n}",
+        inputs=(f"Non Renewable Source {n}.fuel",),
+        outputs=(f"Power Generator {n}.fuel",),
     )
 
     minimal_es = system_model.AbstractEnergySystem(
-        uid="Minimum Self Similar System Model Unit " + str(n),
+        uid=f"Minimum Self Similar System Model Unit {n}",
         busses=(central_bus, fuel_line),
         sinks=(demand_sink, excess_sink),
         sources=(excess_source, non_renewable_source, renewable_source),
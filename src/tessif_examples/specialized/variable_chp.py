@@ -30,7 +30,7 @@ def create_variable_chp():
     # 2. Create a simulation time frame of four one-hour timesteps as a
     # :class:`pandas.DatetimeIndex`:
     periods = 4
-    timeframe = date_range("7/13/1990", periods=periods, freq="H")
+    timeframe = date_range("7/13/1990", periods=periods, freq="h")
 
     global_constraints = {"emissions": float("+inf")}
 
@@ -69,17 +69,11 @@ def create_variable_chp():
         inputs=("gas",),
         outputs=("electricity", "heat"),
         # Minimum number of arguments required
-        enthalpy_loss=nts.MinMax(
-            [1.0 for p in range(0, periods)], [0.18 for p in range(0, periods)]
-        ),
-        power_wo_dist_heat=nts.MinMax(
-            [8 for p in range(0, periods)], [20 for p in range(0, periods)]
-        ),
-        el_efficiency_wo_dist_heat=nts.MinMax(
-            [0.43 for p in range(0, periods)], [0.53 for p in range(0, periods)]
-        ),
-        min_condenser_load=[3 for p in range(0, periods)],
-        power_loss_index=[0.19 for p in range(0, periods)],
+        enthalpy_loss=nts.MinMax([1.0] * periods, [0.18] * periods),
+        power_wo_dist_heat=nts.MinMax([8] * periods, [20] * periods),
+        el_efficiency_wo_dist_heat=nts.MinMax([0.43] * periods, [0.53] * periods),
+        min_condenser_load=[3] * periods,
+        power_loss_index=[0.19] * periods,
         back_pressure=False,
         flow_costs={"electricity": 3, "heat": 2, "gas": 0},
         flow_emissions={"electricity": 2, "heat": 3, "gas": 0},
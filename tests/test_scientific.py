@@ -1,10 +1,153 @@
 """Test scientific examples."""
+import numpy as np
+import pytest
 
 from tessif_examples import scientific
 
+LV = "low-voltage-electricity"
+MV = "medium-voltage-electricity"
+HV = "high-voltage-electricity"
+
+
+def _node(esys, name):
+    """Return the system model's node called ``name``."""
+    return next(node for node in esys.nodes if str(node.uid) == name)
+
 
 def test_basic_examples():
     """Test succesfull system model creation."""
     hhes = scientific.create_hamburg_inspired_hnp_msc()
 
     assert hhes
+
+
+def test_lazy_module_access():
+    """Test the factories' modules being resolved on first access."""
+    assert "component_focused" in dir(scientific)
+    assert hasattr(scientific, "component_focused")
+    assert not hasattr(scientific, "unknown_focused")
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        scientific.create_hamburg_inspired_hnp_msc,
+        scientific.create_lossless_commitment_msc,
+    ],
+)
+def test_non_positive_periods(factory):
+    """Test system model creation rejecting non-positive periods."""
+    with pytest.raises(ValueError, match="'periods' must be positive"):
+        factory(periods=0)
+
+
+def test_profiles_cut_short_by_csv_rows():
+    """Test load profiles ending with their csv file's 24 rows."""
+    esys = scientific.create_lossless_commitment_msc(periods=48)
+    solar_panel = _node(esys, "Solar Panel")
+
+    assert len(esys.timeframe) == 48
+    assert len(solar_panel.timeseries["electricity"].max) == 24
+
+
+def test_independent_profiles():
+    """Test separately created system models owning their load profiles."""
+    solar_panels = [
+        _node(scientific.create_hamburg_inspired_hnp_msc(), "pv1") for _ in range(2)
+    ]
+    first, second = (panel.timeseries["electricity"].max for panel in solar_panels)
+
+    first[0] += 1
+
+    assert not np.shares_memory(first, second)
+    assert first[0] == second[0] + 1
+
+
+def test_independent_timeframes():
+    """Test separately created system models owning their time frames."""
+    first = scientific.create_hamburg_inspired_hnp_msc()
+    first.timeframe.name = "changed"
+    first.timeframe.freq = None
+
+    second = scientific.create_hamburg_inspired_hnp_msc()
+
+    assert second.timeframe is not first.timeframe
+    assert second.timeframe.name is None
+    assert second.timeframe.freq == "h"
+
+
+@pytest.mark.parametrize(
+    "name, conversions, flow_emissions, status_inertia, status_changing_costs",
+    [
+        (
+            "pp1",
+            {("coal", "electricity"): 0.4625},
+            {"coal": 0, "electricity": 0.34 / 0.4625},
+            (0, 7),
+            (49, 0),
+        ),
+        (
+            "chp2",
+            {("gas", "electricity"): 0.585, ("gas", "hot_water"): 0.40},
+            {"gas": 0, "electricity": 0, "hot_water": 0},
+            (0, 5),
+            (40, 0),
+        ),
+    ],
+)
+def test_hamburg_power_plants(
+    name, conversions, flow_emissions, status_inertia, status_changing_costs
+):
+    """Test the hamburg inspired power plants' transformer parameters."""
+    power_plant = _node(scientific.create_hamburg_inspired_hnp_msc(), name)
+
+    assert power_plant.conversions == conversions
+    assert power_plant.flow_emissions == flow_emissions
+    assert power_plant.status_inertia == status_inertia
+    assert power_plant.status_changing_costs == status_changing_costs
+    assert power_plant.initial_status is False
+
+
+@pytest.mark.parametrize(
+    "name, inflow, outflow",
+    [
+        ("Low Medium Transfer", LV, MV),
+        ("Medium Low Transfer", MV, LV),
+        ("Medium High Transfer", MV, HV),
+        ("High Medium Transfer", HV, MV),
+    ],
+)
+def test_expandable_grid_transfers(name, inflow, outflow):
+    """Test the transformer grid's transfers being parameterized as requested."""
+    esys = scientific.create_transformer_grid_focused_msc(
+        transformer_efficiency=0.9, gridcapacity=500, expansion=True
+    )
+    transfer = _node(esys, name)
+
+    assert transfer.conversions == {(inflow, outflow): 0.9}
+    assert transfer.flow_rates == {inflow: (0, float("+inf")), outflow: (0, 500)}
+    assert transfer.expandable == {inflow: False, outflow: True}
+    assert transfer.expansion_limits == {
+        inflow: (500, float("+inf")),
+        outflow: (500, float("+inf")),
+    }
+
+
+@pytest.mark.parametrize(
+    "name, carrier",
+    [
+        ("Deficit Source LV", LV),
+        ("Deficit Source MV", MV),
+        ("Deficit Source HV", HV),
+        ("Excess Sink LV", LV),
+        ("Excess Sink MV", MV),
+        ("Excess Sink HV", HV),
+    ],
+)
+def test_grid_balancing_components(name, carrier):
+    """Test the transformer grid's deficit sources and excess sinks."""
+    component = _node(scientific.create_transformer_grid_focused_msc(), name)
+
+    assert component.flow_rates == {carrier: (0, float("+inf"))}
+    assert component.flow_costs == {carrier: 300}
+    assert component.flow_emissions == {carrier: 0.6}
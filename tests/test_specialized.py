@@ -0,0 +1,130 @@
+"""Test specialized examples."""
+import random
+
+import numpy as np
+import pytest
+
+from tessif_examples import specialized
+
+
+def _node(esys, name):
+    """Return the system model's node called ``name``."""
+    return next(node for node in esys.nodes if str(node.uid) == name)
+
+
+def test_lazy_factory_access():
+    """Test factories and their modules being resolved on first access."""
+    assert {"create_variable_chp", "variable_chp"} <= set(dir(specialized))
+
+    factory = specialized.create_variable_chp
+
+    assert factory is specialized.variable_chp.create_variable_chp
+    assert factory is vars(specialized)["create_variable_chp"]
+
+
+def test_unknown_attribute_access():
+    """Test unknown attributes raising an AttributeError."""
+    with pytest.raises(AttributeError, match="create_unknown"):
+        specialized.create_unknown  # pylint: disable=pointless-statement
+
+
+def _random_flow_rates(esys):
+    """Return the randomized demands and renewable outputs of a system model."""
+    return {
+        str(node.uid): node.flow_rates["electricity"]
+        for node in esys.nodes
+        if str(node.uid).startswith(("Sink", "Renewable Source"))
+    }
+
+
+def test_seeded_self_similar_system_model():
+    """Test the same seed creating the same self similar system model."""
+    first, second = (
+        specialized.create_self_similar_system_model(n=3, seed=42) for _ in range(2)
+    )
+
+    assert _random_flow_rates(first) == _random_flow_rates(second)
+
+
+def test_seeding_keeps_global_random_state():
+    """Test seeded system model creation leaving the random module untouched."""
+    random.seed(1)
+    expected = random.random()
+
+    random.seed(1)
+    specialized.create_self_similar_system_model(n=2, seed=42)
+
+    assert random.random() == expected
+
+
+def test_generic_grid_timeseries():
+    """Test generic grid timeseries being float arrays owned by each model."""
+    solar_panels = [
+        _node(specialized.create_generic_grid(), "Solar Panel") for _ in range(2)
+    ]
+    first, second = (panel.timeseries["electricity"] for panel in solar_panels)
+
+    assert first.min is first.max
+    assert first.max.dtype == np.float64
+    assert first.max.tolist() == [12, 22, 7]
+    assert not np.shares_memory(first.max, second.max)
+
+
+@pytest.mark.parametrize(
+    "factory", [specialized.create_generic_grid, specialized.create_variable_chp]
+)
+def test_independent_timeframes(factory):
+    """Test separately created system models owning their time frames."""
+    first = factory()
+    first.timeframe.freq = None
+
+    second = factory()
+
+    assert second.timeframe is not first.timeframe
+    assert second.timeframe.freq == "h"
+
+
+@pytest.mark.parametrize(
+    "name, carrier, flow_rate, profile",
+    [
+        ("Solar Panel", "electricity", (0, 25), [12, 22, 7]),
+        ("Onshore Wind Power", "electricity", (0, 100), [60, 80, 34]),
+        ("Offshore Wind Power", "electricity", (0, 200), [120, 140, 70]),
+        ("Solar Thermal", "heat", (0, 50), [24, 44, 14]),
+        ("Commercial Demand", "electricity", (0, 200), [80, 20, 130]),
+        ("District Heating Demand", "heat", (300, 500), [340, 300, 380]),
+        ("Industrial Demand", "electricity", (0, 400), [160, 160, 120]),
+        ("Car charging Station", "electricity", (0, 1000), [0, 0, 100]),
+    ],
+)
+def test_generic_grid_fixed_flows(name, carrier, flow_rate, profile):
+    """Test the generic grid's flow rates and fixed flow timeseries."""
+    component = _node(specialized.create_generic_grid(), name)
+    timeseries = component.timeseries[carrier]
+
+    assert component.flow_rates == {carrier: flow_rate}
+    assert timeseries.min.tolist() == timeseries.max.tolist() == profile
+
+
+@pytest.mark.parametrize(
+    "name, flow_rates, status_inertia",
+    [
+        ("Gas Station", {"fuel": (0, 1000)}, (1, 1)),
+        ("Household Demand", {"electricity": (190, 190)}, (2, 1)),
+        (
+            "BHKW",
+            {"fuel": (0, 100), "electricity": (0, 30), "heat": (0, 100)},
+            (0, 1),
+        ),
+        ("Battery", {"electricity": (0, 30)}, (0, 2)),
+        ("Heat Storage", {"heat": (0, 50)}, (0, 2)),
+        ("Pumped Storage", {"electricity": (0, 100)}, (0, 2)),
+    ],
+)
+def test_generic_grid_status_inertia(name, flow_rates, status_inertia):
+    """Test the generic grid's unfixed flow rates and status inertia."""
+    component = _node(specialized.create_generic_grid(), name)
+
+    assert component.flow_rates == flow_rates
+    assert component.timeseries is None
+    assert component.status_inertia == status_inertia